@@ -36,11 +36,32 @@ class ScreenSelector:
         self.selection_rect = None
         self.screenshot_tk = None
         self.preview_image = None
+        self.preview_image_rotated = None
+        
+        # Optional callback run on the Tk thread once a selection is confirmed
+        self.on_complete = None
     
     def is_setup(self):
         """Check if the selection is configured"""
         return self.is_configured
     
+    def reset(self):
+        """Clear the selection so the selector can be reused for a fresh one"""
+        if self.selection_window is not None and self.selection_window.winfo_exists():
+            self.selection_window.destroy()
+        self.selection_window = None
+        self.canvas = None
+        self.selection_rect = None
+        self.screenshot_tk = None
+        self.x1 = None
+        self.y1 = None
+        self.x2 = None
+        self.y2 = None
+        self.is_selecting = False
+        self.is_configured = False
+        self.preview_image = None
+        self.preview_image_rotated = None
+    
     def configure_from_saved(self, x1, y1, x2, y2):
         """Configure selection from saved coordinates without UI interaction
         
@@ -198,6 +219,8 @@ class ScreenSelector:
             self.is_configured = True
             self.logger.info(f"{self.title} selection confirmed: ({self.x1}, {self.y1}) to ({self.x2}, {self.y2})")
             self.selection_window.destroy()
+            if self.on_complete is not None:
+                self.root.after_idle(self.on_complete)
         else:
             self.logger.info(f"{self.title} selection canceled, retrying")
             self.canvas.delete(self.selection_rect)
@@ -241,65 +264,91 @@ class BarDetector:
         self.color_range = color_range
         self.logger = logging.getLogger('PristonBot')
         
+        # Precompute the HSV bounds for this bar so detection allocates nothing
+        if title == "Health":  # Red
+            # Red can wrap around in HSV, so use two ranges
+            bounds = (([0, 50, 50], [10, 255, 255]), ([160, 50, 50], [180, 255, 255]))
+        elif title == "Mana":  # Blue
+            bounds = (([100, 50, 50], [140, 255, 255]),)
+        else:  # Stamina (Green)
+            bounds = (([40, 50, 50], [80, 255, 255]),)
+        self._hsv_ranges = tuple(
+            (np.array(lower, np.uint8), np.array(upper, np.uint8)) for lower, upper in bounds
+        )
+        
+        # Kernel for the morphological clean-up of the mask
+        self._kernel = np.ones((3, 3), np.uint8)
+        
+        # Mask buffers reused across scans, reallocated only if the bar size changes
+        self._mask = None
+        self._extra_mask = None
+        
     def detect_percentage(self, image):
         """
         Detect the percentage of a bar that is filled
         
         Args:
-            image: PIL.Image of the bar
+            image: PIL.Image or RGB numpy array of the bar
             
         Returns:
             Percentage filled (0-100)
         """
         try:
-            # Convert PIL image to numpy array
-            np_image = np.array(image)
+            # View the PIL image as a numpy array without an extra copy
+            np_image = np.asarray(image)
             
             # Convert to HSV for better color detection
             hsv_image = cv2.cvtColor(np_image, cv2.COLOR_RGB2HSV)
+        except Exception as e:
+            self.logger.error(f"Error detecting {self.title} bar percentage: {e}", exc_info=True)
+            return 100  # Default to 100% (full) to avoid unnecessary potion use
+        
+        return self.detect_percentage_hsv(hsv_image)
+    
+    def detect_percentage_hsv(self, hsv_image):
+        """
+        Detect the percentage of a bar that is filled from an HSV image
+        
+        Lets a caller convert a larger capture to HSV once and pass each
+        bar's slice of it.
+        
+        Args:
+            hsv_image: HSV numpy array of the bar (OpenCV ranges)
             
-            # Create mask based on bar color
-            if self.title == "Health":  # Red
-                # Red can wrap around in HSV, so use two ranges
-                lower1 = np.array([0, 50, 50])
-                upper1 = np.array([10, 255, 255])
-                mask1 = cv2.inRange(hsv_image, lower1, upper1)
-                
-                lower2 = np.array([160, 50, 50])
-                upper2 = np.array([180, 255, 255])
-                mask2 = cv2.inRange(hsv_image, lower2, upper2)
-                
-                mask = mask1 | mask2  # Combine both masks
-                
-            elif self.title == "Mana":  # Blue
-                lower = np.array([100, 50, 50])
-                upper = np.array([140, 255, 255])
-                mask = cv2.inRange(hsv_image, lower, upper)
-                
-            else:  # Stamina (Green)
-                lower = np.array([40, 50, 50])
-                upper = np.array([80, 255, 255])
-                mask = cv2.inRange(hsv_image, lower, upper)
+        Returns:
+            Percentage filled (0-100)
+        """
+        try:
+            # Reuse the mask buffers while the bar size stays the same
+            shape = hsv_image.shape[:2]
+            if self._mask is None or self._mask.shape != shape:
+                self._mask = np.empty(shape, np.uint8)
+                self._extra_mask = np.empty(shape, np.uint8)
             
-            # Save the mask for debugging
-            debug_dir = "debug_images"
-            if not os.path.exists(debug_dir):
-                os.makedirs(debug_dir)
-            mask_filename = f"{debug_dir}/{self.title.lower()}_mask_{time.strftime('%H%M%S')}.png"
-            cv2.imwrite(mask_filename, mask)
+            # Create mask based on bar color, OR-ing in any extra ranges
+            (lower, upper), *extra_ranges = self._hsv_ranges
+            mask = cv2.inRange(hsv_image, lower, upper, dst=self._mask)
+            for lower, upper in extra_ranges:
+                cv2.bitwise_or(mask, cv2.inRange(hsv_image, lower, upper, dst=self._extra_mask), dst=mask)
+            
+            # Save the mask for debugging (PNG encoding dwarfs the detection itself)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                debug_dir = "debug_images"
+                if not os.path.exists(debug_dir):
+                    os.makedirs(debug_dir)
+                mask_filename = f"{debug_dir}/{self.title.lower()}_mask_{time.strftime('%H%M%S')}.png"
+                cv2.imwrite(mask_filename, mask)
             
-            # Apply morphological operations to clean up the mask
-            kernel = np.ones((3, 3), np.uint8)
-            mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
-            mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
+            # Apply morphological operations to clean up the mask, in place
+            cv2.morphologyEx(mask, cv2.MORPH_OPEN, self._kernel, dst=mask)
+            cv2.morphologyEx(mask, cv2.MORPH_CLOSE, self._kernel, dst=mask)
             
             # Count non-zero pixels to determine percentage
-            total_pixels = mask.shape[0] * mask.shape[1]
+            total_pixels = mask.size
             if total_pixels == 0:
                 return 0
                 
-            filled_pixels = cv2.countNonZero(mask)
-            percentage = (filled_pixels / total_pixels) * 100
+            percentage = cv2.countNonZero(mask) * 100.0 / total_pixels
             
             self.logger.debug(f"{self.title} bar percentage: {percentage:.1f}%")
             return percentage
@@ -10,7 +10,8 @@ import threading
 import random
 import math
 from PIL import Image
-from app.window_utils import press_key, press_right_mouse, get_window_rect
+from app.window_utils import press_key, get_window_rect
+from app.windows_utils.mouse import press_right_mouse
 from app.bar_selector import BarDetector, HEALTH_COLOR_RANGE, MANA_COLOR_RANGE, STAMINA_COLOR_RANGE
 from app.bot.interfaces import BarManager, SettingsProvider, WindowManager
 
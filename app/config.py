@@ -10,6 +10,9 @@ import logging
 from logging.handlers import RotatingFileHandler
 import json
 
+# Text of config.json as last read or written, to skip rewriting identical content
+_saved_text = None
+
 # Default configuration
 DEFAULT_CONFIG = {
     "potion_keys": {
@@ -126,10 +129,13 @@ def load_config():
     """Load configuration from file or create default if not exists"""
     config_path = 'config.json'
     
+    global _saved_text
     if os.path.exists(config_path):
         try:
             with open(config_path, 'r') as f:
-                config = json.load(f)
+                text = f.read()
+                config = json.loads(text)
+                _saved_text = text
                 logging.getLogger('PristonBot').info("Configuration loaded from file")
                 
                 # Check if random targeting config exists, add it if not (for backward compatibility)
@@ -167,11 +173,21 @@ def load_config():
     return DEFAULT_CONFIG
 
 def save_config(config):
-    """Save configuration to file"""
+    """Save configuration to file, skipping the write if nothing changed"""
+    global _saved_text
     config_path = 'config.json'
     try:
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=4)
+        text = json.dumps(config, indent=4)
+        if text == _saved_text and os.path.exists(config_path):
+            logging.getLogger('PristonBot').debug("Configuration unchanged, not saving")
+            return
+        
+        # Write to a temporary file and swap it in, so a failed write never truncates the config
+        temp_path = config_path + '.tmp'
+        with open(temp_path, 'w') as f:
+            f.write(text)
+        os.replace(temp_path, config_path)
+        _saved_text = text
         logging.getLogger('PristonBot').info("Configuration saved to file")
     except Exception as e:
         logging.getLogger('PristonBot').error(f"Error saving configuration: {e}")
\ No newline at end of file
@@ -0,0 +1,17 @@
+"""
+Game Input for Priston Tale Potion Bot
+--------------------------------------
+This module is the single place the bot gets its keyboard, mouse and window
+functions from, so callers import them directly instead of carrying their
+own fallbacks.
+"""
+
+from app.windows_utils.keyboard import press_key
+from app.windows_utils.mouse import move_mouse_direct, press_right_mouse, cast_spell_steps
+from app.windows_utils.windows_management import find_game_window, focus_game_window
+
+__all__ = [
+    'press_key',
+    'move_mouse_direct', 'press_right_mouse', 'cast_spell_steps',
+    'find_game_window', 'focus_game_window',
+]
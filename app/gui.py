@@ -5,6 +5,8 @@ This module contains the main GUI class with practical horizontal layout
 that maintains all functionality in a single window.
 """
 
+import collections
+import threading
 import time
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
@@ -19,6 +21,11 @@ from app.ui.config_manager_ui import ConfigManagerUI
 
 logger = logging.getLogger('PristonBot')
 
+# Log display batching: pending lines are inserted every LOG_FLUSH_MS,
+# and the widget keeps at most LOG_MAX_LINES lines
+LOG_FLUSH_MS = 100
+LOG_MAX_LINES = 2000
+
 # Global reference to the main application instance
 main_app = None
 
@@ -40,9 +47,8 @@ class PristonTaleBot:
         self.root.geometry("900x700")  # Wider initial size for better horizontal layout
         self.root.minsize(800, 600)    # Minimum size
         
-        # Create main container
+        # Create main container; it is packed once everything inside it is built
         main_frame = ttk.Frame(root)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Create title with version
         title_frame = ttk.Frame(main_frame)
@@ -104,6 +110,16 @@ class PristonTaleBot:
         self.log_text = scrolledtext.ScrolledText(log_container, height=10, width=40, wrap=tk.WORD)
         self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
+        # Lines waiting to be inserted into the log display; the UI thread
+        # picks them up on its own timer, so log() never touches Tk
+        self._log_buf = collections.deque(maxlen=LOG_MAX_LINES)
+        self._log_lock = threading.Lock()
+        self.root.after(LOG_FLUSH_MS, self._flush_log)
+        
+        # Timestamp prefix, formatted once per second
+        self._ts_sec = 0
+        self._ts_str = ""
+        
         # Create settings frame in right column
         settings_frame = ttk.LabelFrame(right_column, text="Settings", padding=5)
         settings_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 5))
@@ -137,6 +153,9 @@ class PristonTaleBot:
             self.log
         )
         
+        # Show the finished widget tree so its geometry is computed in one pass
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
         # Initial log entry
         self.log("Bot GUI initialized successfully")
         
@@ -147,30 +166,65 @@ class PristonTaleBot:
             self.log("No saved configuration found or loading failed")
             self.log("Please select the Health, Mana, and Stamina bars to continue")
         
-        # Check if bars are configured periodically
+        # Check the loaded bar configuration, then refresh the start button
+        # whenever the number of configured bars changes
         self.check_bar_config()
+        self.bar_selector_ui.add_config_listener(self.check_bar_config)
         
         # Set up window close handler to save configuration
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
         logger.info("Bot GUI initialized")
     
-    def log(self, message):
-        """Add a message to the log display"""
-        timestamp = time.strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
-        # Also log to the logger
-        logger.info(message)
+    def log(self, message, to_logger=True):
+        """
+        Add a message to the log display (safe to call from any thread)
+        
+        Args:
+            message: Message to show
+            to_logger: Whether to also write the message to the logger at INFO
+        """
+        now = int(time.time())
+        with self._log_lock:
+            if now != self._ts_sec:
+                self._ts_sec = now
+                self._ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+            self._log_buf.append(f"[{self._ts_str}] {message}\n")
+        # Also log to the logger, unless the caller has already done so
+        if to_logger:
+            logger.info(message)
+    
+    def _flush_log(self):
+        """Insert all pending log lines into the log display in one go, every LOG_FLUSH_MS"""
+        with self._log_lock:
+            batch = "".join(self._log_buf)
+            self._log_buf.clear()
+        
+        if batch:
+            self.log_text.insert(tk.END, batch)
+            
+            # Drop the oldest lines beyond LOG_MAX_LINES
+            excess = int(self.log_text.index("end-1c").split(".")[0]) - 1 - LOG_MAX_LINES
+            if excess > 0:
+                self.log_text.delete("1.0", f"{excess + 1}.0")
+            self.log_text.see(tk.END)
+        
+        self.root.after(LOG_FLUSH_MS, self._flush_log)
     
     def start_window_selection(self):
         """Start the game window selection process"""
         self.bar_selector_ui.start_window_selection()
     
-    def check_bar_config(self):
-        """Check if all bars are configured and enable the start button if they are"""
+    def check_bar_config(self, configured=None):
+        """
+        Check if all bars are configured and enable the start button if they are
+        
+        Args:
+            configured: Number of configured bars, or None to count them
+        """
         # Count configured bars
-        configured = self.bar_selector_ui.get_configured_count()
+        if configured is None:
+            configured = self.bar_selector_ui.get_configured_count()
         
         if configured > 0:
             self.bot_controller.set_status(f"{configured}/3 bars configured")
@@ -183,10 +237,6 @@ class PristonTaleBot:
             logger.info("All bars configured, start button enabled")
         else:
             self.bot_controller.disable_start_button()
-            
-        # Check again later if not all configured yet
-        if configured < 3:
-            self.root.after(1000, self.check_bar_config)
     
     def save_config(self):
         """Save the configuration"""
@@ -84,8 +84,9 @@ class TargetZoneSelector:
                 self.logger.info(f"Loaded {len(valid_points)} target points from saved configuration")
                 
                 # Log the actual points for debugging
-                for i, point in enumerate(self.target_points):
-                    self.logger.debug(f"Target point {i}: ({point[0]}, {point[1]})")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    for i, point in enumerate(self.target_points):
+                        self.logger.debug(f"Target point {i}: ({point[0]}, {point[1]})")
         
         # If no valid points were provided or loaded, generate new ones
         if not self.target_points or len(self.target_points) == 0:
@@ -422,8 +423,9 @@ class TargetZoneSelector:
         self.logger.info(f"Generated {len(self.target_points)} target points")
         
         # Additional logging to help with debugging
-        for i, point in enumerate(self.target_points):
-            self.logger.debug(f"Target point {i}: ({point[0]}, {point[1]})")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for i, point in enumerate(self.target_points):
+                self.logger.debug(f"Target point {i}: ({point[0]}, {point[1]})")
     
     def get_random_target(self):
         """Get a random target point within the selection
@@ -434,7 +436,7 @@ class TargetZoneSelector:
         # If we have target points, choose one randomly
         if self.target_points and len(self.target_points) > 0:
             chosen_point = random.choice(self.target_points)
-            self.logger.debug(f"Selected target point: {chosen_point}")
+            self.logger.debug("Selected target point: %s", chosen_point)
             return chosen_point
         
         # Fallback: If no target points available, generate a random point
@@ -446,7 +448,7 @@ class TargetZoneSelector:
         x = random.randint(self.x1, self.x2)
         y = random.randint(self.y1, self.y2)
         
-        self.logger.debug(f"Generated fallback point: ({x}, {y})")
+        self.logger.debug("Generated fallback point: (%d, %d)", x, y)
         return (x, y)
         
     def get_serializable_points(self):
@@ -38,6 +38,13 @@ class BarSelectorUI:
         self.sp_bar_selector = ScreenSelector(root)
         self.game_window = ScreenSelector(root)
         
+        # Callbacks notified with the new count when the number of configured bars changes
+        self._config_listeners = []
+        self._configured_count = 0
+        
+        # Game window image the main window preview was last built from
+        self._window_preview_source = None
+        
         # Create the UI
         self._create_ui()
         
@@ -101,19 +108,24 @@ class BarSelectorUI:
     
     def start_window_selection(self):
         """Start the game window selection process"""
-        self.game_window = ScreenSelector(self.root)  # Recreate for fresh selection
+        self.game_window.reset()  # Clear the previous selection
+        # Show the preview as soon as the selection is confirmed
+        self.game_window.on_complete = self.update_window_preview
         self.game_window.start_selection(title="Game Window", color="yellow")
-        # Schedule an update to check if the selection was completed
-        self.root.after(1000, self.update_window_preview)
     
     def update_window_preview(self):
         """Update the preview of the game window"""
         if self.game_window.is_setup():
-            if hasattr(self.game_window, 'preview_image') and self.game_window.preview_image is not None:
+            if self.game_window.preview_image is not None:
+                if self.game_window.preview_image is self._window_preview_source:
+                    return  # already showing this image
+                self._window_preview_source = self.game_window.preview_image
                 try:
-                    # Resize the image to fit in the label
+                    # Resize the image to fit in the label; bilinear resampling
+                    # still averages over the whole source area when shrinking
+                    # and is plenty for a thumbnail this size
                     preview_size = (200, 150)  # Width, height
-                    resized_img = self.game_window.preview_image.resize(preview_size, Image.LANCZOS)
+                    resized_img = self.game_window.preview_image.resize(preview_size, Image.BILINEAR)
                     preview_photo = ImageTk.PhotoImage(resized_img)
                     
                     # Update the window preview in main app
@@ -134,12 +146,6 @@ class BarSelectorUI:
                     self.log_callback(f"Game window selected: ({self.game_window.x1},{self.game_window.y1}) to ({self.game_window.x2},{self.game_window.y2})")
                 except Exception as e:
                     logger.error(f"Error displaying window preview: {e}")
-            else:
-                # Try again later
-                self.root.after(500, self.update_window_preview)
-        else:
-            # Check again later
-            self.root.after(1000, self.update_window_preview)
     
     def start_bar_selection(self, bar_type, color):
         """Start the selection process for a specific bar"""
@@ -168,10 +174,10 @@ class BarSelectorUI:
     def update_preview_image(self, selector, label):
         """Update the preview image for a bar"""
         if selector.is_setup():
-            if hasattr(selector, 'preview_image') and selector.preview_image is not None:
+            if selector.preview_image is not None:
                 try:
                     # Check if we have a rotated preview for vertical bars
-                    preview_img = selector.preview_image_rotated if hasattr(selector, 'preview_image_rotated') and selector.preview_image_rotated is not None else selector.preview_image
+                    preview_img = selector.preview_image_rotated if selector.preview_image_rotated is not None else selector.preview_image
                     
                     # Resize the image to fit in the label
                     preview_size = (100, 60)  # Width, height
@@ -183,9 +189,6 @@ class BarSelectorUI:
                     # Log the selection
                     self.log_callback(f"{selector.title} selected: ({selector.x1},{selector.y1}) to ({selector.x2},{selector.y2})")
                     
-                    # Update status display
-                    self.update_status()
-                    
                 except Exception as e:
                     # If resize fails, show coords
                     logger.error(f"Error displaying preview image: {e}")
@@ -193,16 +196,34 @@ class BarSelectorUI:
             else:
                 # If no preview image yet, show coords
                 label.config(text=f"Selected: ({selector.x1},{selector.y1}) to ({selector.x2},{selector.y2})")
+            
+            # Update status display
+            self.update_status()
         else:
             label.config(text="Not Selected")
             
             # Check again later
             self.root.after(1000, lambda: self.update_preview_image(selector, label))
     
+    def add_config_listener(self, callback):
+        """
+        Register a callback for changes in the number of configured bars
+        
+        Args:
+            callback: Function called with the new configured count
+        """
+        self._config_listeners.append(callback)
+    
     def update_status(self):
         """Update the status display with bar configuration count"""
         count = self.get_configured_count()
         self.status_var.set(f"Bars Configured: {count}/3")
+        
+        # Notify listeners only when the count actually changed
+        if count != self._configured_count:
+            self._configured_count = count
+            for callback in self._config_listeners:
+                callback(count)
     
     def is_bars_configured(self):
         """Check if all bars are configured"""
@@ -8,11 +8,16 @@ CRITICAL FIX: Corrected import paths and added fallback handling.
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
+import collections
+import queue
+import sys
 import threading
 import time
 import random
 import math
-from PIL import Image
+import numpy as np
+import cv2
+from PIL import Image, ImageGrab
 
 # FIXED: Import the Largato Hunter with proper path and fallback
 try:
@@ -34,129 +39,40 @@ except ImportError:
         def stop_hunt(self):
             return True
 
-# First try to import the windows_utils mouse functions
-try:
-    from app.windows_utils.mouse import move_mouse_direct, press_right_mouse
-except ImportError:
-    # Fallback to older window_utils if needed
-    try:
-        from app.window_utils import press_right_mouse, get_window_rect
-    except ImportError:
-        def press_right_mouse(*args, **kwargs):
-            logger = logging.getLogger('PristonBot')
-            logger.warning("press_right_mouse not available")
-            return False
-        def get_window_rect(*args, **kwargs):
-            return None
-    
-    # Define move_mouse_direct as fallback
-    def move_mouse_direct(x, y):
-        """Fallback mouse movement function"""
-        logger = logging.getLogger('PristonBot')
-        logger.warning(f"Using fallback mouse movement to ({x}, {y})")
-        import ctypes
-        try:
-            ctypes.windll.user32.SetCursorPos(int(x), int(y))
-            return True
-        except Exception as e:
-            logger.error(f"Error in fallback mouse movement: {e}")
-            return False
+from app.game_input import press_key, cast_spell_steps
+from app.bar_selector import BarDetector, HEALTH_COLOR_RANGE, MANA_COLOR_RANGE, STAMINA_COLOR_RANGE
+from app.config import load_config
+from app.windows_utils.screen_capture import ScreenCapture
 
-# Import press_key function specifically
-try:
-    from app.windows_utils.keyboard import press_key
-except ImportError:
-    try:
-        from app.window_utils import press_key
-    except ImportError:
-        # Define press_key fallback if we can't import it
-        def press_key(hwnd, key):
-            """Fallback press_key function"""
-            logger = logging.getLogger('PristonBot')
-            logger.info(f"Using fallback key press for '{key}'")
-            import ctypes
-            
-            # Map common keys to virtual key codes
-            key_map = {
-                '1': 0x31, '2': 0x32, '3': 0x33, '4': 0x34, '5': 0x35,
-                '6': 0x36, '7': 0x37, '8': 0x38, '9': 0x39, '0': 0x30,
-                'f1': 0x70, 'f2': 0x71, 'f3': 0x72, 'f4': 0x73,
-                'f5': 0x74, 'f6': 0x75, 'f7': 0x76, 'f8': 0x77,
-                'f9': 0x78, 'f10': 0x79, 'f11': 0x7A, 'f12': 0x7B,
-                'up': 0x26, 'down': 0x28, 'left': 0x25, 'right': 0x27,
-                'x': 0x58, 'space': 0x20, 'enter': 0x0D
-            }
-            
-            # Get virtual key code
-            if isinstance(key, str):
-                key = key.lower()
-                vk_code = key_map.get(key)
-                if vk_code is None:
-                    try:
-                        vk_code = ord(key.upper()[0])
-                    except:
-                        logger.error(f"Could not determine virtual key code for '{key}'")
-                        return False
-            else:
-                vk_code = key
-                
-            try:
-                # Define key event flags
-                KEYEVENTF_KEYDOWN = 0x0000
-                KEYEVENTF_KEYUP = 0x0002
-                
-                # Send key down
-                ctypes.windll.user32.keybd_event(vk_code, 0, KEYEVENTF_KEYDOWN, 0)
-                time.sleep(0.05)  # Small delay between down and up
-                
-                # Send key up
-                ctypes.windll.user32.keybd_event(vk_code, 0, KEYEVENTF_KEYUP, 0)
-                
-                return True
-            except Exception as e:
-                logger.error(f"Error pressing key '{key}': {e}")
-                return False
+logger = logging.getLogger('PristonBot')
 
-# Import focus_game_window, with fallback if not found
-try:
-    from app.windows_utils.windows_management import focus_game_window
-except ImportError:
-    try:
-        from app.window_utils import focus_game_window
-    except ImportError:
-        def focus_game_window(hwnd):
-            """Fallback function if module isn't created yet"""
-            logger = logging.getLogger('PristonBot')
-            logger.warning(f"Using fallback for window focus")
-            try:
-                import win32gui
-                return win32gui.SetForegroundWindow(hwnd) if hwnd else False
-            except Exception as e:
-                logger.error(f"Error in fallback focus: {e}")
-                return False
+# Nanoseconds per second, for converting settings to perf_counter_ns units
+NS_PER_SECOND = 1_000_000_000
 
-# Import additional functions for window detection
-try:
-    from app.windows_utils.windows_management import find_game_window
-except ImportError:
-    try:
-        from app.window_utils import find_game_window
-    except ImportError:
-        def find_game_window(window_name="Priston Tale"):
-            """Fallback function to find game window"""
-            logger = logging.getLogger('PristonBot')
-            logger.warning(f"Using fallback to find game window: {window_name}")
-            try:
-                import win32gui
-                return win32gui.FindWindow(None, window_name)
-            except Exception as e:
-                logger.error(f"Error in fallback window finding: {e}")
-                return None
+# Minimum bar change, in tenths of a percent, that is logged and shown
+CHANGE_TENTHS = 5
 
-from app.bar_selector import BarDetector, HEALTH_COLOR_RANGE, MANA_COLOR_RANGE, STAMINA_COLOR_RANGE
-from app.config import load_config
+# Bars this many points above their thresholds are only checked once per
+# SAFE_SCAN_INTERVAL; after any bar comes closer, full rate is kept for FAST_MODE_DURATION
+SAFE_MARGIN = 20.0
+SAFE_SCAN_INTERVAL = 1 * NS_PER_SECOND
+FAST_MODE_DURATION = 2 * NS_PER_SECOND
 
-logger = logging.getLogger('PristonBot')
+# After this many capture failures in a row, bar checks back off from
+# CAPTURE_RETRY_DELAY, doubling per further failure up to CAPTURE_RETRY_MAX
+CAPTURE_FAILURES_BEFORE_BACKOFF = 3
+CAPTURE_RETRY_DELAY = 50_000_000
+CAPTURE_RETRY_MAX = 500_000_000
+
+# While the bot runs, the UI thread applies its display updates every this many ms
+UI_PUSH_MS = 50
+
+# (display name, settings key) for each potion bar, in array order
+POTION_BARS = (
+    ("Health", "health"),
+    ("Mana", "mana"),
+    ("Stamina", "stamina"),
+)
 
 class BotControllerUI:
     """Class that handles the bot control UI and logic with Largato Hunt support"""
@@ -186,26 +102,69 @@ class BotControllerUI:
         self.hp_detector = BarDetector("Health", HEALTH_COLOR_RANGE)
         self.mp_detector = BarDetector("Mana", MANA_COLOR_RANGE)
         self.sp_detector = BarDetector("Stamina", STAMINA_COLOR_RANGE)
+        self._detectors = (self.hp_detector, self.mp_detector, self.sp_detector)
+        
+        # Union bbox of the configured bars and each bar's slice into it
+        self._capture_bbox = None
+        self._bar_regions = (None, None, None)
+        self._screen_capture = None  # owned by the bot thread while it runs
+        self._capture_failures = 0  # consecutive failed captures
+        
+        # Previous capture and readings, to skip detection on unchanged bars
+        self._last_frame = None
+        self._last_percents = np.full(len(POTION_BARS), 100.0)
+        
+        # Per-scan buffers, reused every tick (the HSV one is sized on first use)
+        self._hsv = None
+        self._percents = np.empty(len(POTION_BARS))
+        self._tenths = np.empty(len(POTION_BARS), dtype=np.int64)
         
         # Bot state
         self.running = False
         self.bot_thread = None
+        self._tick = self._tick_without_spell
+        
+        # (tk variable, value) display updates collected during a tick
+        self._ui_updates = []
+        
+        # Latest value per tk variable waiting for the UI thread, and whether the
+        # UI thread's timer that applies them is active
+        self._ui_lock = threading.Lock()
+        self._ui_pending = {}
+        self._ui_pump_active = False
+        
+        # Pending (perf_counter_ns deadline, action) steps of an in-progress cast
+        self._action_queue = collections.deque()
+        
+        # Settings unpacked from the settings UI, refreshed when its version changes
+        self._settings_version = None
+        self._thresholds = None
+        self._potion_keys = None
+        self._spell_key = None
+        self._spell_interval = None
+        self._scan_interval = None
+        self._potion_cooldown = None
         
         # Largato Hunt state
         self.largato_running = False
         self.largato_hunter = None
         
-        # Store previous bar values to detect changes
-        self.prev_hp_percent = 100.0
-        self.prev_mp_percent = 100.0
-        self.prev_sp_percent = 100.0
+        # Previous bar values in integer tenths of a percent, to detect changes
+        # (in POTION_BARS order)
+        self.prev_tenths = np.full(len(POTION_BARS), 1000, dtype=np.int64)
+        
+        # Bar-check pacing, see SAFE_MARGIN (perf_counter_ns)
+        self._next_bar_check = 0
+        self._fast_mode_until = 0
         
-        # Statistics
-        self.hp_potions_used = 0
-        self.mp_potions_used = 0
-        self.sp_potions_used = 0
+        # Values currently shown in the value labels, in tenths of a percent
+        self._shown_tenths = [1000, 1000, 1000]
+        
+        # Statistics (potions_used is indexed in POTION_BARS order)
+        self.potions_used = [0, 0, 0]
         self.spells_cast = 0
-        self.start_time = None
+        self.start_time = None  # perf_counter_ns at start
+        self._shown_runtime = None  # whole seconds currently in runtime_var
         
         # Random targeting variables
         self.target_x_offset = 0
@@ -229,8 +188,16 @@ class BotControllerUI:
         else:
             self.log_callback("Warning: Largato Hunt module not available")
         
+        # Log records from the bot thread are written by a separate thread
+        # so file and UI logging never block the polling loop
+        self._log_q = queue.SimpleQueue()
+        self._log_writer = threading.Thread(target=self._log_writer_loop, daemon=True)
+        self._log_writer.start()
+        
         # Create the UI
         self._create_ui()
+        self._potion_vars = (self.hp_potions_var, self.mp_potions_var, self.sp_potions_var)
+        self._value_vars = (self.hp_value_var, self.mp_value_var, self.sp_value_var)
         
         # Set up keyboard shortcuts
         self._setup_keyboard_shortcuts()
@@ -572,9 +539,7 @@ class BotControllerUI:
         self.running = True
         
         # Reset statistics
-        self.hp_potions_used = 0
-        self.mp_potions_used = 0
-        self.sp_potions_used = 0
+        self.potions_used = [0, 0, 0]
         self.spells_cast = 0
         
         self.hp_potions_var.set("0")
@@ -587,16 +552,31 @@ class BotControllerUI:
         self.target_y_offset = 0
         self.spells_cast_since_target_change = 0
         
-        # Store start time
-        self.start_time = time.time()
+        # Store start time; the bot loop pushes the runtime display from it
+        self.start_time = time.perf_counter_ns()
+        self._shown_runtime = 0
+        self.runtime_var.set("00:00:00")
+        
+        # Unpack settings and pick the tick variant before the thread starts
+        # (get_settings first publishes any change still waiting for idle)
+        self.settings_ui.get_settings()
+        self._load_settings()
+        
+        # Work out the single screen area that covers all three bars
+        self._prepare_bar_capture()
+        
+        # Pay OpenCV's first-call setup and size the scan buffers now, not on the first scan
+        self._warm_up_detection()
         
-        # Start runtime updater
-        self._update_runtime()
+        # Resolve the game window once per run instead of inside the bot loop
+        # (a missing window is logged there)
+        self._find_and_setup_game_window()
         
         # Start the bot thread
         self.bot_thread = threading.Thread(target=self.bot_loop)
         self.bot_thread.daemon = True
         self.bot_thread.start()
+        self._start_ui_pump()
         
         logger.info("Bot thread started")
         
@@ -659,20 +639,46 @@ class BotControllerUI:
         
         return configured == 3
     
-    def _update_runtime(self):
-        """Update the runtime display"""
-        if self.running and self.start_time:
-            # Calculate elapsed time
-            elapsed = time.time() - self.start_time
-            hours = int(elapsed // 3600)
-            minutes = int((elapsed % 3600) // 60)
-            seconds = int(elapsed % 60)
-            
-            # Update display
-            self.runtime_var.set(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+    def _format_runtime(self, elapsed):
+        """
+        Format the runtime display
+        
+        Args:
+            elapsed: Whole seconds since the bot was started
             
-            # Schedule next update
-            self.root.after(1000, self._update_runtime)
+        Returns:
+            Runtime as HH:MM:SS
+        """
+        hours, remainder = divmod(elapsed, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    
+    def _queue_ui_updates(self):
+        """Hand the current tick's display updates to the UI thread without any Tk call"""
+        with self._ui_lock:
+            for var, value in self._ui_updates:
+                self._ui_pending[str(var)] = (var, value)
+        self._ui_updates.clear()
+    
+    def _start_ui_pump(self):
+        """Start the UI thread's timer that applies the bot's display updates"""
+        if not self._ui_pump_active:
+            self._ui_pump_active = True
+            self.root.after(UI_PUSH_MS, self._push_ui_snapshot)
+    
+    def _push_ui_snapshot(self):
+        """Apply the latest pending display updates on the UI thread in one burst"""
+        with self._ui_lock:
+            pending = self._ui_pending
+            self._ui_pending = {}
+        for var, value in pending.values():
+            var.set(value)
+        
+        # Keep polling until the bot thread has finished and everything is applied
+        if self.running or (self.bot_thread is not None and self.bot_thread.is_alive()) or self._ui_pending:
+            self.root.after(UI_PUSH_MS, self._push_ui_snapshot)
+        else:
+            self._ui_pump_active = False
     
     def enable_start_button(self):
         """Enable the start button if no other bot is running"""
@@ -688,19 +694,38 @@ class BotControllerUI:
         """Set the status message"""
         self.status_var.set(message)
     
-    def has_value_changed(self, prev_val, current_val, threshold=0.5):
+    def _log(self, msg, *args, level=logging.INFO, exc_info=False):
         """
-        Check if a value has changed beyond a threshold
+        Format a message once and queue it for both the logger and the UI log
         
         Args:
-            prev_val: Previous value
-            current_val: Current value
-            threshold: Change threshold (default 0.5%)
-            
-        Returns:
-            True if the value has changed beyond the threshold
+            msg: Message, optionally with %-style placeholders
+            *args: Values for the placeholders
+            level: Logging level (default INFO)
+            exc_info: Whether to attach the current exception to the log record
         """
-        return abs(prev_val - current_val) >= threshold
+        if not logger.isEnabledFor(level):
+            return
+        formatted = msg % args if args else msg
+        # Capture the exception here; the writer thread has its own exc_info
+        if exc_info:
+            exc_info = sys.exc_info()
+        self._log_q.put_nowait((level, formatted, exc_info))
+    
+    def _log_writer_loop(self):
+        """Drain queued log records into the logger and the UI log"""
+        while True:
+            level, message, exc_info = self._log_q.get()
+            try:
+                logger.log(level, message, exc_info=exc_info)
+                # The record is already written above, so the UI log only displays it;
+                # debug records stay out of the display
+                if level >= logging.INFO:
+                    # Only buffers the line; the UI thread inserts it on its own timer
+                    self.log_callback(message, to_logger=False)
+            except Exception as e:
+                # The UI may already be gone during shutdown
+                logger.debug(f"Could not deliver log message: {e}")
     
     def generate_random_target_offsets(self, radius):
         """
@@ -724,7 +749,14 @@ class BotControllerUI:
         return x_offset, y_offset
         
     def _find_and_setup_game_window(self):
-        """Find and set up the game window for targeting"""
+        """
+        Find and set up the game window for targeting
+        
+        Returns:
+            True if the game window rect was resolved
+        """
+        self.game_window_rect = None
+        
         # Try several methods to find the game window
         
         # 1. First try to load from config
@@ -741,9 +773,8 @@ class BotControllerUI:
                     y2 = window_config["y2"]
                     
                     self.game_window_rect = (x1, y1, x2, y2)
-                    self.log_callback(f"Game window found in configuration: ({x1},{y1})-({x2},{y2})")
                     self.window_var.set(f"Config: {x2-x1}x{y2-y1}")
-                    logger.info(f"Game window loaded from config: ({x1},{y1})-({x2},{y2})")
+                    self._log("Game window found in configuration: (%s,%s)-(%s,%s)", x1, y1, x2, y2)
                     return True
         except Exception as e:
             logger.error(f"Error loading game window from config: {e}")
@@ -751,161 +782,326 @@ class BotControllerUI:
         # Additional methods from original implementation...
         # (keeping the rest of the original method for compatibility)
         
-        self.log_callback("WARNING: Game window could not be detected")
-        logger.warning("Failed to find game window through any method")
+        self._log("WARNING: Game window could not be detected", level=logging.WARNING)
         return False
     
+    def _load_settings(self):
+        """Unpack the current settings into attributes used by the bot tick"""
+        self._settings_version, settings = self.settings_ui.get_published_settings()
+        spellcasting = settings["spellcasting"]
+        
+        self._thresholds = np.array([settings["thresholds"][key] for _, key in POTION_BARS], dtype=float)
+        self._potion_keys = tuple(settings["potion_keys"][key] for _, key in POTION_BARS)
+        self._spell_key = spellcasting["spell_key"]
+        self._spell_interval = int(spellcasting["spell_interval"] * NS_PER_SECOND)
+        self._scan_interval = int(settings["scan_interval"] * NS_PER_SECOND)
+        self._potion_cooldown = int(settings.get("potion_cooldown", 3.0) * NS_PER_SECOND)
+        
+        # Thresholds may have moved, so don't wait out a slow-rate bar check
+        self._next_bar_check = 0
+        
+        # Specialize the tick so the disabled spell path is never evaluated
+        if spellcasting["enabled"]:
+            self._tick = self._tick_with_spell
+        else:
+            self._tick = self._tick_without_spell
+    
+    def _prepare_bar_capture(self):
+        """Compute the screen area covering every configured bar and each bar's slice of it"""
+        bars = (self.hp_bar, self.mp_bar, self.sp_bar)
+        configured = [bar for bar in bars if bar.is_setup()]
+        if not configured:
+            self._capture_bbox = None
+            self._bar_regions = (None, None, None)
+            return
+        
+        left = min(bar.x1 for bar in configured)
+        top = min(bar.y1 for bar in configured)
+        right = max(bar.x2 for bar in configured)
+        bottom = max(bar.y2 for bar in configured)
+        self._capture_bbox = (left, top, right, bottom)
+        self._bar_regions = tuple(
+            (slice(bar.y1 - top, bar.y2 - top), slice(bar.x1 - left, bar.x2 - left))
+            if bar.is_setup() else None
+            for bar in bars
+        )
+        logger.debug(f"Bar capture area: {self._capture_bbox}")
+    
+    def _warm_up_detection(self):
+        """Run each detector once on a blank capture of the configured size"""
+        if self._capture_bbox is None:
+            return
+        try:
+            start = time.perf_counter_ns()
+            left, top, right, bottom = self._capture_bbox
+            self._hsv = np.zeros((bottom - top, right - left, 3), dtype=np.uint8)
+            cv2.cvtColor(self._hsv, cv2.COLOR_RGB2HSV, dst=self._hsv)
+            for detector, region in zip(self._detectors, self._bar_regions):
+                if region is not None:
+                    detector.detect_percentage_hsv(self._hsv[region])
+            logger.debug(f"Detection warm-up took {(time.perf_counter_ns() - start) / 1e6:.1f} ms")
+        except Exception as e:
+            logger.error(f"Error warming up detection: {e}")
+    
+    def _capture_bars(self):
+        """
+        Capture the area covering all bars in a single grab
+        
+        Returns:
+            RGB numpy array of the capture area, valid until the capture
+            after next, or None if nothing to capture or the capture failed
+        """
+        if self._capture_bbox is None:
+            return None
+        try:
+            if self._screen_capture is not None:
+                screen = self._screen_capture.grab()
+            else:
+                screen = np.asarray(ImageGrab.grab(bbox=self._capture_bbox))
+        except OSError as e:
+            # Transient capture failures (desktop switch, lock screen); log once per burst
+            self._capture_failures += 1
+            if self._capture_failures == 1:
+                self._log("Error capturing bars: %s", e, level=logging.WARNING)
+            return None
+        
+        if self._capture_failures:
+            self._log("Bar capture recovered after %d failed attempts", self._capture_failures)
+            self._capture_failures = 0
+        return screen
+    
+    def _check_bars_and_potions(self, current_time):
+        """
+        Read the three bars and use potions where a threshold is crossed
+        
+        Args:
+            current_time: perf_counter_ns timestamp of the current tick
+        """
+        # Healthy bars were checked recently enough; skip capture and detection
+        if current_time < self._next_bar_check:
+            return
+        
+        # Grab all bars in one capture; without one there is nothing to act on this tick
+        screen = self._capture_bars()
+        if screen is None:
+            # Retry on the next tick at first, then back off if the failure persists
+            failures = self._capture_failures - CAPTURE_FAILURES_BEFORE_BACKOFF
+            if failures >= 0:
+                self._next_bar_check = current_time + min(CAPTURE_RETRY_DELAY << min(failures, 4),
+                                                          CAPTURE_RETRY_MAX)
+            return
+        
+        # Initialize status values (in POTION_BARS order)
+        percents = self._percents
+        percents.fill(100.0)
+        
+        # Measure each bar from its slice of the capture
+        last_frame = self._last_frame
+        if last_frame is not None and last_frame.shape != screen.shape:
+            last_frame = None
+        
+        hsv = None
+        for i, region in enumerate(self._bar_regions):
+            if region is None:
+                continue
+            # Identical pixels give an identical reading, so reuse it (the max absolute
+            # difference is computed over packed bytes without a temporary mask)
+            if last_frame is not None and cv2.norm(screen[region], last_frame[region], cv2.NORM_INF) == 0:
+                percents[i] = self._last_percents[i]
+                continue
+            # Convert the whole capture to HSV once, on the first bar that needs it
+            if hsv is None:
+                if self._hsv is None or self._hsv.shape != screen.shape:
+                    self._hsv = np.empty_like(screen)
+                hsv = cv2.cvtColor(screen, cv2.COLOR_RGB2HSV, dst=self._hsv)
+            percents[i] = self._detectors[i].detect_percentage_hsv(hsv[region])
+        
+        # Keep this capture for the next comparison; capture buffers alternate,
+        # so holding a reference is enough
+        self._last_frame = screen
+        self._last_percents[:] = percents
+        
+        # Compare in integer tenths of a percent, the resolution the bars are shown at
+        tenths = self._tenths
+        np.rint(percents * 10, out=tenths, casting='unsafe')
+        
+        # Log all percentages in a single line if any have changed
+        if (np.abs(tenths - self.prev_tenths) >= CHANGE_TENTHS).any():
+            self._log("Health: %.1f%% | Mana: %.1f%% | Stamina: %.1f%%", *percents)
+            
+            # Update previous values
+            self.prev_tenths[:] = tenths
+            
+            # Update UI values, formatting only the labels whose shown value changed
+            for i, shown in enumerate(tenths.tolist()):
+                if shown != self._shown_tenths[i]:
+                    self._shown_tenths[i] = shown
+                    self._ui_updates.append((self._value_vars[i], f"{shown / 10:.1f}%"))
+        
+        # Decide which potions to use in one vectorized threshold + cooldown test
+        thresholds = self._thresholds
+        
+        # Back off to the slow check rate only while every bar is well clear of its threshold
+        if (percents - thresholds).min() > SAFE_MARGIN:
+            if current_time >= self._fast_mode_until:
+                self._next_bar_check = current_time + SAFE_SCAN_INTERVAL
+        else:
+            self._fast_mode_until = current_time + FAST_MODE_DURATION
+        
+        fire = (percents < thresholds) & (current_time - self._last_potion_times > self._potion_cooldown)
+        
+        for i in np.flatnonzero(fire):
+            name, settings_key = POTION_BARS[i]
+            key = self._potion_keys[i]
+            self._log("%s low (%.1f%% < %s%%), using %s potion (key %s)",
+                      name, percents[i], thresholds[i], settings_key, key)
+            press_key(None, key)
+            self._last_potion_times[i] = current_time
+            
+            # Update statistics
+            self.potions_used[i] += 1
+            self._ui_updates.append((self._potion_vars[i], str(self.potions_used[i])))
+    
+    def _cast_spell_if_due(self, current_time):
+        """
+        Cast the configured spell if the spell interval has elapsed
+        
+        Args:
+            current_time: perf_counter_ns timestamp of the current tick
+        """
+        if current_time >= self._next_spell_cast:
+            # Don't start a new cast while the previous one is still running
+            if self._action_queue:
+                return
+            
+            # Queue the key press and right-click on a timeline so bar checks
+            # keep running between the steps instead of sleeping through them
+            try:
+                deadline = current_time
+                for delay, action in cast_spell_steps(self._spell_key):
+                    deadline += int(delay * NS_PER_SECOND)
+                    self._action_queue.append((deadline, action))
+            except Exception as e:
+                logger.error(f"Error casting spell: {e}")
+            
+            # Update state
+            self._next_spell_cast = current_time + self._spell_interval
+            self.spells_cast += 1
+            self._ui_updates.append((self.spells_var, str(self.spells_cast)))
+    
+    def _run_due_actions(self):
+        """Run every queued cast step whose deadline has passed"""
+        actions = self._action_queue
+        while actions and actions[0][0] <= time.perf_counter_ns():
+            _, action = actions.popleft()
+            try:
+                action()
+            except Exception as e:
+                logger.error(f"Error casting spell: {e}")
+    
+    def _tick_without_spell(self):
+        """Run one bot iteration with spellcasting disabled"""
+        # Get current monotonic time for potion cooldowns
+        current_time = time.perf_counter_ns()
+        
+        self._check_bars_and_potions(current_time)
+    
+    def _tick_with_spell(self):
+        """Run one bot iteration with spellcasting enabled"""
+        # Get current monotonic time for potion cooldowns
+        current_time = time.perf_counter_ns()
+        
+        self._check_bars_and_potions(current_time)
+        self._cast_spell_if_due(current_time)
+    
     def bot_loop(self):
         """Main bot loop that checks bars and uses potions (original implementation)"""
-        # This contains the original bot loop implementation
-        # (keeping all the original functionality for regular bot operation)
-        
-        last_hp_potion = 0
-        last_mp_potion = 0
-        last_sp_potion = 0
-        last_spell_cast = 0
-        potion_cooldown = 3.0  # seconds
+        # Cooldown state shared by the tick methods, in perf_counter_ns units.
+        # Start far enough in the past that the first tick may act immediately.
+        never = time.perf_counter_ns() - 3600 * NS_PER_SECOND
+        self._last_potion_times = np.full(len(POTION_BARS), never, dtype=np.int64)
+        self._next_spell_cast = 0  # deadline for the next cast; cast on the first tick
+        self._next_bar_check = 0
+        self._fast_mode_until = 0
+        self._last_frame = None
+        self._capture_failures = 0
         loop_count = 0
         
-        self.log_callback("Bot started")
-        logger.info("Bot loop started")
+        self._log("Bot started")
         
-        # Find and set up game window
-        game_window_found = self._find_and_setup_game_window()
-        
-        if not game_window_found:
-            self.log_callback("WARNING: Game window not detected. Some functionality may not work properly.")
+        # Reuse one set of capture buffers for the whole run
+        if self._capture_bbox is not None:
+            try:
+                self._screen_capture = ScreenCapture(self._capture_bbox)
+            except Exception as e:
+                logger.warning(f"Falling back to ImageGrab for bar capture: {e}")
         
-        # Rest of the original bot loop implementation...
-        # (keeping all existing functionality)
+        # Ticks are scheduled against fixed deadlines so the time spent
+        # inside a tick does not stretch the scan interval
+        next_tick = time.perf_counter_ns()
+        settings_ui = self.settings_ui
+        loop_errors = 0  # consecutive failed iterations
         
         while self.running:
             try:
-                loop_count += 1
-                logger.debug(f"Bot loop iteration {loop_count}")
-                
-                # Get current time for potion cooldowns
-                current_time = time.time()
-                
-                # Get the latest settings
-                settings = self.settings_ui.get_settings()
-                
-                # Initialize status values
-                hp_percent = 100.0
-                mp_percent = 100.0
-                sp_percent = 100.0
-                hp_threshold = settings["thresholds"]["health"]
-                mp_threshold = settings["thresholds"]["mana"]
-                sp_threshold = settings["thresholds"]["stamina"]
-                
-                # Check HP bar
-                if self.hp_bar.is_setup():
-                    hp_image = self.hp_bar.get_current_screenshot_region()
-                    if hp_image:
-                        hp_percent = self.hp_detector.detect_percentage(hp_image)
-                
-                # Check MP bar
-                if self.mp_bar.is_setup():
-                    mp_image = self.mp_bar.get_current_screenshot_region()
-                    if mp_image:
-                        mp_percent = self.mp_detector.detect_percentage(mp_image)
-                
-                # Check SP bar
-                if self.sp_bar.is_setup():
-                    sp_image = self.sp_bar.get_current_screenshot_region()
-                    if sp_image:
-                        sp_percent = self.sp_detector.detect_percentage(sp_image)
-                
-                # Check if any values have changed
-                hp_changed = self.has_value_changed(self.prev_hp_percent, hp_percent)
-                mp_changed = self.has_value_changed(self.prev_mp_percent, mp_percent)
-                sp_changed = self.has_value_changed(self.prev_sp_percent, sp_percent)
-                
-                # Log all percentages in a single line if any have changed
-                if hp_changed or mp_changed or sp_changed:
-                    status_message = (f"Health: {hp_percent:.1f}% | " +
-                                    f"Mana: {mp_percent:.1f}% | " +
-                                    f"Stamina: {sp_percent:.1f}%")
-                    self.log_callback(status_message)
-                    logger.debug(status_message)
+                now = time.perf_counter_ns()
+                if now >= next_tick:
+                    loop_count += 1
+                    logger.debug("Bot loop iteration %d", loop_count)
                     
-                    # Update previous values
-                    self.prev_hp_percent = hp_percent
-                    self.prev_mp_percent = mp_percent
-                    self.prev_sp_percent = sp_percent
+                    # Re-read settings only when the settings UI reports a change
+                    if settings_ui.settings_version != self._settings_version:
+                        self._load_settings()
                     
-                    # Update UI values
-                    self.hp_value_var.set(f"{hp_percent:.1f}%")
-                    self.mp_value_var.set(f"{mp_percent:.1f}%")
-                    self.sp_value_var.set(f"{sp_percent:.1f}%")
-                
-                # Use Health potion if needed
-                if hp_percent < hp_threshold and current_time - last_hp_potion > potion_cooldown:
-                    hp_key = settings["potion_keys"]["health"]
-                    self.log_callback(f"Health low ({hp_percent:.1f}%), using health potion (key {hp_key})")
-                    logger.info(f"Using health potion - HP: {hp_percent:.1f}% < {hp_threshold}%")
-                    press_key(None, hp_key)
-                    last_hp_potion = current_time
+                    self._tick()
                     
-                    # Update statistics
-                    self.hp_potions_used += 1
-                    self.hp_potions_var.set(str(self.hp_potions_used))
-                
-                # Use Mana potion if needed
-                if mp_percent < mp_threshold and current_time - last_mp_potion > potion_cooldown:
-                    mp_key = settings["potion_keys"]["mana"]
-                    self.log_callback(f"Mana low ({mp_percent:.1f}%), using mana potion (key {mp_key})")
-                    logger.info(f"Using mana potion - MP: {mp_percent:.1f}% < {mp_threshold}%")
-                    press_key(None, mp_key)
-                    last_mp_potion = current_time
+                    if loop_errors:
+                        self._log("Bot loop recovered after %d errors", loop_errors)
+                        loop_errors = 0
                     
-                    # Update statistics
-                    self.mp_potions_used += 1
-                    self.mp_potions_var.set(str(self.mp_potions_used))
-                
-                # Use Stamina potion if needed
-                if sp_percent < sp_threshold and current_time - last_sp_potion > potion_cooldown:
-                    sp_key = settings["potion_keys"]["stamina"]
-                    self.log_callback(f"Stamina low ({sp_percent:.1f}%), using stamina potion (key {sp_key})")
-                    logger.info(f"Using stamina potion - SP: {sp_percent:.1f}% < {sp_threshold}%")
-                    press_key(None, sp_key)
-                    last_sp_potion = current_time
+                    # Update the runtime only when the shown second changes
+                    elapsed = (now - self.start_time) // NS_PER_SECOND
+                    if elapsed != self._shown_runtime:
+                        self._shown_runtime = elapsed
+                        self._ui_updates.append((self.runtime_var, self._format_runtime(elapsed)))
+                    
+                    # Hand everything this tick changed to the UI thread at once
+                    if self._ui_updates:
+                        self._queue_ui_updates()
                     
-                    # Update statistics
-                    self.sp_potions_used += 1
-                    self.sp_potions_var.set(str(self.sp_potions_used))
+                    next_tick += self._scan_interval
+                    now = time.perf_counter_ns()
+                    if next_tick < now:
+                        # Fell behind; restart the schedule rather than bursting to catch up
+                        next_tick = now
                 
-                # Spellcasting logic (keeping original implementation)
-                if settings["spellcasting"]["enabled"]:
-                    spell_interval = settings["spellcasting"]["spell_interval"]
-                    if current_time - last_spell_cast > spell_interval:
-                        spell_key = settings["spellcasting"]["spell_key"]
-                        
-                        # Press the spell key
-                        press_key(None, spell_key)
-                        
-                        # Small delay before right-clicking
-                        time.sleep(0.1)
-                        
-                        # Right-click (simplified for compatibility)
-                        try:
-                            press_right_mouse(None)
-                        except Exception as e:
-                            logger.error(f"Error with right-click: {e}")
-                        
-                        # Update state
-                        last_spell_cast = current_time
-                        self.spells_cast += 1
-                        self.spells_var.set(str(self.spells_cast))
+                self._run_due_actions()
                 
-                # Wait for next scan
-                scan_interval = settings["scan_interval"]
-                time.sleep(scan_interval)
+                # Wait for the next scan deadline or queued cast step, whichever is first
+                wake = next_tick
+                if self._action_queue:
+                    wake = min(wake, self._action_queue[0][0])
+                delay = wake - time.perf_counter_ns()
+                if delay > 0:
+                    time.sleep(delay / NS_PER_SECOND)
                 
             except Exception as e:
-                self.log_callback(f"Error in bot loop: {e}")
-                logger.error(f"Error in bot loop: {e}", exc_info=True)
-                time.sleep(1)
+                # Log the first error of a burst only, then carry on at the normal scan rate
+                loop_errors += 1
+                if loop_errors == 1:
+                    self._log("Error in bot loop: %s", e, level=logging.ERROR, exc_info=True)
+                next_tick = time.perf_counter_ns() + self._scan_interval
+        
+        if self._screen_capture is not None:
+            self._screen_capture.close()
+            self._screen_capture = None
+        
+        # Finish any half-done cast so no key or button is left held down
+        while self._action_queue:
+            _, action = self._action_queue.popleft()
+            try:
+                action()
+            except Exception as e:
+                logger.error(f"Error casting spell: {e}")
         
-        self.log_callback("Bot stopped")
-        logger.info("Bot loop stopped")
\ No newline at end of file
+        self._log("Bot stopped")
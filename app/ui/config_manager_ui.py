@@ -218,8 +218,8 @@ class ConfigManagerUI:
                 # Update the preview
                 self.bar_selector_ui.update_preview_image(sp_bar, self.bar_selector_ui.sp_preview_label)
             
-            # Load settings to the settings UI
-            self.settings_ui.set_settings(config)
+            # Load settings to the settings UI once startup has drawn the window
+            self.settings_ui.set_settings_when_idle(config)
             
             # Return success if any bars were configured
             if bars_configured > 0:
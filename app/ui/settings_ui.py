@@ -11,6 +11,73 @@ import logging
 
 logger = logging.getLogger('PristonBot')
 
+# Choices offered by the potion and spell key comboboxes
+POTION_KEYS = tuple("123456789")
+SPELL_KEYS = ("F1", "F2", "F3", "F4", "F5", "F6", "F7", "F8", "F9", "F10", "F11", "F12")
+
+# Shared fallback for missing settings sections; only ever read
+_EMPTY = {}
+
+# Slider value label formats, with the texts for every slider position
+# formatted once up front and keyed by the displayed value (in tenths for the
+# seconds sliders)
+_PERCENT_FORMAT = "{:.0f}%"
+_POINTS_FORMAT = "{:.0f} points"
+_SECONDS_FORMAT = "{:.1f}s"
+_PERCENT_TEXTS = {i: _PERCENT_FORMAT.format(i) for i in range(1, 100)}
+_POINTS_TEXTS = {i: _POINTS_FORMAT.format(i) for i in range(4, 17)}
+_SECONDS_TEXTS = {i: _SECONDS_FORMAT.format(i / 10) for i in range(1, 101)}
+
+# Every slider by variable attribute, as (from, to, resolution, value label
+# width, label format, label scale, preformatted label texts); resolution is
+# None for the free ttk sliders holding whole numbers
+_SLIDERS = {
+    "hp_threshold_var": (1, 99, None, 4, _PERCENT_FORMAT, 1, _PERCENT_TEXTS),
+    "mp_threshold_var": (1, 99, None, 4, _PERCENT_FORMAT, 1, _PERCENT_TEXTS),
+    "sp_threshold_var": (1, 99, None, 4, _PERCENT_FORMAT, 1, _PERCENT_TEXTS),
+    "spell_interval_var": (0.5, 10.0, 0.1, 5, _SECONDS_FORMAT, 10, _SECONDS_TEXTS),
+    "target_points_var": (4, 16, None, 8, _POINTS_FORMAT, 1, _POINTS_TEXTS),
+    "scan_interval_var": (0.1, 2.0, 0.1, 5, _SECONDS_FORMAT, 10, _SECONDS_TEXTS),
+    "potion_cooldown_var": (1.0, 10.0, 0.1, 5, _SECONDS_FORMAT, 10, _SECONDS_TEXTS)
+}
+
+# Every setting held in a Tk variable, as (section, key, variable attribute,
+# variable type, default); section is None for top-level keys. The variables,
+# the settings dictionary and set_settings are all driven from this table.
+# The target zone is not a plain variable and is handled separately.
+_SETTINGS_SCHEMA = (
+    # Potion settings
+    ("thresholds", "health", "hp_threshold_var", tk.IntVar, 50),
+    ("thresholds", "mana", "mp_threshold_var", tk.IntVar, 30),
+    ("thresholds", "stamina", "sp_threshold_var", tk.IntVar, 40),
+    ("potion_keys", "health", "hp_key_var", tk.StringVar, "1"),
+    ("potion_keys", "mana", "mp_key_var", tk.StringVar, "3"),
+    ("potion_keys", "stamina", "sp_key_var", tk.StringVar, "2"),
+    
+    # Spell settings
+    ("spellcasting", "enabled", "spellcast_enabled", tk.BooleanVar, False),
+    ("spellcasting", "spell_key", "spell_key_var", tk.StringVar, "F1"),
+    ("spellcasting", "spell_interval", "spell_interval_var", tk.DoubleVar, 1.2),
+    ("spellcasting", "use_target_zone", "use_target_zone_var", tk.BooleanVar, True),
+    ("spellcasting", "target_points_count", "target_points_var", tk.IntVar, 8),
+    
+    # Advanced settings
+    (None, "scan_interval", "scan_interval_var", tk.DoubleVar, 0.5),
+    (None, "potion_cooldown", "potion_cooldown_var", tk.DoubleVar, 3.0),
+    (None, "debug_enabled", "debug_var", tk.BooleanVar, True)
+)
+
+def _set_if_changed(var, value):
+    """
+    Set a Tk variable only if its value differs, so unchanged settings fire no traces
+    
+    Args:
+        var: Tk variable to update
+        value: New value
+    """
+    if var.get() != value:
+        var.set(value)
+
 class SettingsUI:
     """Class that handles the settings UI with horizontal layout and slider controls"""
     
@@ -25,9 +92,62 @@ class SettingsUI:
         self.parent = parent
         self.save_callback = save_callback
         
-        # Create the UI
+        # Settings dict rebuilt on the UI thread once a burst of changes settles,
+        # and published with a version number so the bot thread can pick it up
+        # without touching Tk
+        self._settings_version = 0
+        self._settings_cache = None
+        self._published_settings = (0, None)
+        self._settings_dirty = True
+        self._refresh_pending = False
+        
+        # Create the settings variables, then the UI bound to them
+        self._create_variables()
         self._create_ui()
         
+        # Watch every settings variable for changes
+        for _, _, attr, _, _ in _SETTINGS_SCHEMA:
+            getattr(self, attr).trace_add("write", self._on_setting_changed)
+        
+        self._refresh_settings()
+    
+    def _on_setting_changed(self, *args):
+        """Mark the settings as changed and schedule one rebuild for the whole burst"""
+        self._settings_dirty = True
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.parent.after_idle(self._refresh_settings)
+    
+    def _refresh_settings(self):
+        """Rebuild and publish the settings dictionary if anything changed"""
+        self._refresh_pending = False
+        if not self._settings_dirty:
+            return
+        self._settings_dirty = False
+        self._settings_cache = self._build_settings()
+        self._settings_version += 1
+        self._published_settings = (self._settings_version, self._settings_cache)
+        
+    def _create_variables(self):
+        """Create the variables holding every setting, independent of the tab widgets"""
+        for _, _, attr, var_type, default in _SETTINGS_SCHEMA:
+            setattr(self, attr, var_type(value=default))
+        
+        self.target_zone_var = tk.StringVar(value="Not Configured")
+        self.target_zone_selector = None
+        
+        # One handler formats every slider's value label from a trace on its
+        # variable, so labels follow both drags and set_settings. The labels'
+        # text variables are registered by Tcl variable name as their tab is built.
+        self._value_labels = {}
+        self._value_labels_pending = set()
+        self._value_shown = {}
+        self._value_formats = {}
+        for attr, spec in _SLIDERS.items():
+            var = getattr(self, attr)
+            self._value_formats[str(var)] = spec[4:]
+            var.trace_add("write", lambda *args, var=var: self._schedule_value_label(var))
+    
     def _create_ui(self):
         """Create the UI components with horizontal layout"""
         # Create notebook (tabs) for settings categories
@@ -49,11 +169,12 @@ class SettingsUI:
         # Create potion settings
         self._create_potion_settings(potion_tab)
         
-        # Create spell settings
-        self._create_spell_settings(spell_tab)
-        
-        # Create advanced settings
-        self._create_advanced_settings(adv_tab)
+        # Spell and advanced settings are built the first time their tab is shown
+        self._unbuilt_tabs = {
+            str(spell_tab): self._create_spell_settings,
+            str(adv_tab): self._create_advanced_settings
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Save button at the bottom
         save_frame = ttk.Frame(self.parent)
@@ -81,89 +202,17 @@ class SettingsUI:
                  text="Set when potions should be used (percentage of bar remaining)").pack(
                      anchor=tk.W, pady=(0, 5))
         
-        # Health threshold with slider
-        hp_frame = ttk.Frame(thresholds_frame)
-        hp_frame.pack(fill=tk.X, pady=2)
-        
-        ttk.Label(hp_frame, text="Health %:", width=12).pack(side=tk.LEFT)
-        
-        # Create a frame for the slider and value display
-        hp_slider_frame = ttk.Frame(hp_frame)
-        hp_slider_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        # Create a variable to hold the slider value
-        self.hp_threshold_var = tk.IntVar(value=50)
-        
-        # Create the slider
-        self.hp_threshold = ttk.Scale(
-            hp_slider_frame, 
-            from_=1, 
-            to=99, 
-            orient=tk.HORIZONTAL, 
-            variable=self.hp_threshold_var,
-            command=self._update_hp_label
-        )
-        self.hp_threshold.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
-        
-        # Create a label to display the current value
-        self.hp_value_label = ttk.Label(hp_slider_frame, text="50%", width=4)
-        self.hp_value_label.pack(side=tk.LEFT)
-        
-        # Mana threshold with slider
-        mp_frame = ttk.Frame(thresholds_frame)
-        mp_frame.pack(fill=tk.X, pady=2)
-        
-        ttk.Label(mp_frame, text="Mana %:", width=12).pack(side=tk.LEFT)
-        
-        # Create a frame for the slider and value display
-        mp_slider_frame = ttk.Frame(mp_frame)
-        mp_slider_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        # Create a variable to hold the slider value
-        self.mp_threshold_var = tk.IntVar(value=30)
-        
-        # Create the slider
-        self.mp_threshold = ttk.Scale(
-            mp_slider_frame, 
-            from_=1, 
-            to=99, 
-            orient=tk.HORIZONTAL, 
-            variable=self.mp_threshold_var,
-            command=self._update_mp_label
-        )
-        self.mp_threshold.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
-        
-        # Create a label to display the current value
-        self.mp_value_label = ttk.Label(mp_slider_frame, text="30%", width=4)
-        self.mp_value_label.pack(side=tk.LEFT)
-        
-        # Stamina threshold with slider
-        sp_frame = ttk.Frame(thresholds_frame)
-        sp_frame.pack(fill=tk.X, pady=2)
-        
-        ttk.Label(sp_frame, text="Stamina %:", width=12).pack(side=tk.LEFT)
-        
-        # Create a frame for the slider and value display
-        sp_slider_frame = ttk.Frame(sp_frame)
-        sp_slider_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        # Create a variable to hold the slider value
-        self.sp_threshold_var = tk.IntVar(value=40)
-        
-        # Create the slider
-        self.sp_threshold = ttk.Scale(
-            sp_slider_frame, 
-            from_=1, 
-            to=99, 
-            orient=tk.HORIZONTAL, 
-            variable=self.sp_threshold_var,
-            command=self._update_sp_label
+        # One slider row per potion threshold, laid out from a single table
+        threshold_rows = (
+            ("Health %:", "hp_threshold_var"),
+            ("Mana %:", "mp_threshold_var"),
+            ("Stamina %:", "sp_threshold_var")
         )
-        self.sp_threshold.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
-        
-        # Create a label to display the current value
-        self.sp_value_label = ttk.Label(sp_slider_frame, text="40%", width=4)
-        self.sp_value_label.pack(side=tk.LEFT)
+        slider_grid = self._create_slider_grid(thresholds_frame)
+        self.hp_threshold, self.mp_threshold, self.sp_threshold = [
+            self._create_slider_row(slider_grid, row, text, attr)
+            for row, (text, attr) in enumerate(threshold_rows)
+        ]
         
         # Potion keys frame
         keys_frame = ttk.LabelFrame(parent, text="Potion Keys", padding=5)
@@ -178,50 +227,113 @@ class SettingsUI:
         key_frame = ttk.Frame(keys_frame)
         key_frame.pack(fill=tk.X, pady=5)
         
-        # Health key
-        hp_key_frame = ttk.Frame(key_frame)
-        hp_key_frame.pack(fill=tk.X, pady=2)
-        
-        ttk.Label(hp_key_frame, text="Health Key:", width=12).pack(side=tk.LEFT)
-        self.hp_key = ttk.Combobox(hp_key_frame, values=list("123456789"), width=3)
-        self.hp_key.set("1")
-        self.hp_key.pack(side=tk.LEFT)
+        # One grid row per potion key, laid out from a single table
+        key_rows = (
+            ("Health Key:", self.hp_key_var),
+            ("Mana Key:", self.mp_key_var),
+            ("Stamina Key:", self.sp_key_var)
+        )
+        key_boxes = []
+        for row, (text, var) in enumerate(key_rows):
+            ttk.Label(key_frame, text=text, width=12).grid(row=row, column=0, sticky=tk.W, pady=2)
+            key_box = ttk.Combobox(key_frame, textvariable=var, values=POTION_KEYS, width=3, state="readonly")
+            key_box.grid(row=row, column=1, sticky=tk.W, pady=2)
+            key_boxes.append(key_box)
+        self.hp_key, self.mp_key, self.sp_key = key_boxes
+    
+    def _create_slider_grid(self, parent):
+        """
+        Create a frame that lays slider rows out in aligned grid columns
         
-        # Mana key
-        mp_key_frame = ttk.Frame(key_frame)
-        mp_key_frame.pack(fill=tk.X, pady=2)
+        Args:
+            parent: Frame to add the grid to
+            
+        Returns:
+            The grid frame, with the slider column stretching to fill it
+        """
+        grid = ttk.Frame(parent)
+        grid.pack(fill=tk.X)
+        grid.columnconfigure(1, weight=1)
+        return grid
+    
+    def _create_slider_row(self, parent, row, text, attr):
+        """
+        Create a labelled slider row with a display of its current value
         
-        ttk.Label(mp_key_frame, text="Mana Key:", width=12).pack(side=tk.LEFT)
-        self.mp_key = ttk.Combobox(mp_key_frame, values=list("123456789"), width=3)
-        self.mp_key.set("3")
-        self.mp_key.pack(side=tk.LEFT)
+        Args:
+            parent: Grid frame from _create_slider_grid to add the row to
+            row: Grid row to place the widgets in
+            text: Label shown before the slider
+            attr: Attribute name of the slider's variable, as listed in _SLIDERS
+            
+        Returns:
+            The slider widget
+        """
+        from_, to, resolution, value_width = _SLIDERS[attr][:4]
+        variable = getattr(self, attr)
         
-        # Stamina key
-        sp_key_frame = ttk.Frame(key_frame)
-        sp_key_frame.pack(fill=tk.X, pady=2)
+        ttk.Label(parent, text=text, width=12).grid(row=row, column=0, sticky=tk.W, pady=2)
         
-        ttk.Label(sp_key_frame, text="Stamina Key:", width=12).pack(side=tk.LEFT)
-        self.sp_key = ttk.Combobox(sp_key_frame, values=list("123456789"), width=3)
-        self.sp_key.set("2")
-        self.sp_key.pack(side=tk.LEFT)
+        if resolution is None:
+            slider = ttk.Scale(parent, from_=from_, to=to, orient=tk.HORIZONTAL, variable=variable)
+        else:
+            # The classic Scale snaps its value in Tk, so the variable is only
+            # written when the slider crosses a step rather than on every pixel
+            slider = tk.Scale(parent, from_=from_, to=to, orient=tk.HORIZONTAL, variable=variable,
+                              resolution=resolution, showvalue=0, highlightthickness=0)
+        slider.grid(row=row, column=1, sticky=tk.EW, padx=(0, 5), pady=2)
+        
+        value_text = tk.StringVar()
+        ttk.Label(parent, textvariable=value_text, width=value_width).grid(row=row, column=2, pady=2)
+        self._value_labels[str(variable)] = value_text
+        self._update_value_label(variable)
+        return slider
     
-    def _update_hp_label(self, value):
-        """Update the health threshold label when the slider is moved"""
-        # Round to integer
-        value = int(float(value))
-        self.hp_value_label.config(text=f"{value}%")
+    def _schedule_value_label(self, variable):
+        """
+        Update a slider variable's label once the UI is idle
+        
+        Every write during a drag lands here, but only the first of a burst
+        schedules an update, which then shows whatever the latest value is.
+        
+        Args:
+            variable: Slider variable whose label to update
+        """
+        name = str(variable)
+        if name not in self._value_labels_pending:
+            self._value_labels_pending.add(name)
+            self.parent.after_idle(self._update_value_label, variable)
     
-    def _update_mp_label(self, value):
-        """Update the mana threshold label when the slider is moved"""
-        # Round to integer
-        value = int(float(value))
-        self.mp_value_label.config(text=f"{value}%")
+    def _update_value_label(self, variable):
+        """
+        Show a slider variable's current value in its label
+        
+        Args:
+            variable: Slider variable whose label to update
+        """
+        name = str(variable)
+        self._value_labels_pending.discard(name)
+        value_text = self._value_labels.get(name)
+        if value_text is None:
+            return  # tab not built yet; the label is filled in when it is
+        
+        # IntVar.get() already truncates to a whole number and DoubleVar values
+        # are rounded to the tenths shown, so the label is only touched when the
+        # displayed value steps
+        fmt, scale, texts = self._value_formats[name]
+        step = round(variable.get() * scale)
+        if step != self._value_shown.get(name):
+            self._value_shown[name] = step
+            # Only a loaded value outside the slider range needs formatting here
+            text = texts.get(step) or fmt.format(step / scale)
+            value_text.set(text)
     
-    def _update_sp_label(self, value):
-        """Update the stamina threshold label when the slider is moved"""
-        # Round to integer
-        value = int(float(value))
-        self.sp_value_label.config(text=f"{value}%")
+    def _on_tab_changed(self, event):
+        """Build the selected tab's widgets if it is shown for the first time"""
+        tab = self.notebook.select()
+        create = self._unbuilt_tabs.pop(tab, None)
+        if create is not None:
+            create(self.notebook.nametowidget(tab))
     
     def _create_spell_settings(self, parent):
         """Create the spell settings UI"""
@@ -238,7 +350,6 @@ class SettingsUI:
         enable_frame = ttk.Frame(spell_frame)
         enable_frame.pack(fill=tk.X, pady=5)
         
-        self.spellcast_enabled = tk.BooleanVar(value=False)
         enable_check = ttk.Checkbutton(
             enable_frame, 
             text="Enable Auto Spellcasting", 
@@ -253,39 +364,16 @@ class SettingsUI:
         ttk.Label(key_frame, text="Spell Key:", width=12).pack(side=tk.LEFT)
         self.spell_key = ttk.Combobox(
             key_frame, 
-            values=["F1", "F2", "F3", "F4", "F5", "F6", "F7", "F8", "F9", "F10", "F11", "F12"], 
-            width=5
+            textvariable=self.spell_key_var,
+            values=SPELL_KEYS, 
+            width=5,
+            state="readonly"
         )
-        self.spell_key.set("F1")
         self.spell_key.pack(side=tk.LEFT)
         
         # Spell interval with slider
-        interval_frame = ttk.Frame(spell_frame)
-        interval_frame.pack(fill=tk.X, pady=2)
-        
-        ttk.Label(interval_frame, text="Cast Interval:", width=12).pack(side=tk.LEFT)
-        
-        # Create a frame for the slider and value display
-        interval_slider_frame = ttk.Frame(interval_frame)
-        interval_slider_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        # Create a variable to hold the slider value
-        self.spell_interval_var = tk.DoubleVar(value=1.2)
-        
-        # Create the slider
-        self.spell_interval = ttk.Scale(
-            interval_slider_frame, 
-            from_=0.5, 
-            to=10.0, 
-            orient=tk.HORIZONTAL, 
-            variable=self.spell_interval_var,
-            command=self._update_interval_label
-        )
-        self.spell_interval.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
-        
-        # Create a label to display the current value
-        self.interval_value_label = ttk.Label(interval_slider_frame, text="1.2s", width=5)
-        self.interval_value_label.pack(side=tk.LEFT)
+        self.spell_interval = self._create_slider_row(
+            self._create_slider_grid(spell_frame), 0, "Cast Interval:", "spell_interval_var")
         
         # Monster Target Zone frame
         target_frame = ttk.LabelFrame(parent, text="Monster Target Zone", padding=5)
@@ -299,7 +387,6 @@ class SettingsUI:
         use_zone_frame = ttk.Frame(target_frame)
         use_zone_frame.pack(fill=tk.X, pady=2)
         
-        self.use_target_zone_var = tk.BooleanVar(value=True)
         use_zone_check = ttk.Checkbutton(
             use_zone_frame,
             text="Use target zone for spell targeting",
@@ -312,7 +399,6 @@ class SettingsUI:
         status_frame.pack(fill=tk.X, pady=2)
         
         ttk.Label(status_frame, text="Status:", width=12).pack(side=tk.LEFT)
-        self.target_zone_var = tk.StringVar(value="Not Configured")
         ttk.Label(status_frame, textvariable=self.target_zone_var).pack(side=tk.LEFT)
         
         # Select button
@@ -324,50 +410,14 @@ class SettingsUI:
         select_button.pack(fill=tk.X, pady=5)
         
         # Target points count slider
-        points_frame = ttk.Frame(target_frame)
-        points_frame.pack(fill=tk.X, pady=2)
-        
-        ttk.Label(points_frame, text="Target Points:", width=12).pack(side=tk.LEFT)
-        
-        # Create a frame for the slider and value display
-        points_slider_frame = ttk.Frame(points_frame)
-        points_slider_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        # Create a variable to hold the slider value
-        self.target_points_var = tk.IntVar(value=8)
-        
-        # Create the slider
-        self.target_points = ttk.Scale(
-            points_slider_frame, 
-            from_=4, 
-            to=16, 
-            orient=tk.HORIZONTAL, 
-            variable=self.target_points_var,
-            command=self._update_points_label
-        )
-        self.target_points.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
-        
-        # Create a label to display the current value
-        self.points_value_label = ttk.Label(points_slider_frame, text="8 points", width=8)
-        self.points_value_label.pack(side=tk.LEFT)
+        self.target_points = self._create_slider_row(
+            self._create_slider_grid(target_frame), 0, "Target Points:", "target_points_var")
         
         # Additional info
         ttk.Label(target_frame, 
                  text="Character is assumed to be in the center of game window").pack(
                      anchor=tk.W, pady=(5, 0))
     
-    def _update_interval_label(self, value):
-        """Update the spell interval label when the slider is moved"""
-        # Round to 1 decimal place
-        value = round(float(value), 1)
-        self.interval_value_label.config(text=f"{value}s")
-    
-    def _update_points_label(self, value):
-        """Update the target points label when the slider is moved"""
-        # Round to integer
-        value = int(float(value))
-        self.points_value_label.config(text=f"{value} points")
-
     def _select_target_zone(self):
         """Launch the target zone selector"""
         from app.target_zone_selector import TargetZoneSelector
@@ -380,16 +430,8 @@ class SettingsUI:
             self.target_zone_var.set(f"Configured ({len(target_selector.target_points)} points)")
             self.target_zone_selector = target_selector
             
-            # Store the target zone data in settings
-            settings = self.get_settings()
-            if "target_zone" not in settings["spellcasting"]:
-                settings["spellcasting"]["target_zone"] = {}
-                
-            settings["spellcasting"]["target_zone"]["x1"] = target_selector.x1
-            settings["spellcasting"]["target_zone"]["y1"] = target_selector.y1
-            settings["spellcasting"]["target_zone"]["x2"] = target_selector.x2
-            settings["spellcasting"]["target_zone"]["y2"] = target_selector.y2
-            settings["spellcasting"]["target_zone"]["points"] = target_selector.get_serializable_points()
+            # get_settings picks the zone up from the selector on its next call
+            self._on_setting_changed()
             
             # Save configuration
             if callable(self.save_callback):
@@ -407,67 +449,19 @@ class SettingsUI:
                      anchor=tk.W, pady=(0, 5))
         
         # Scan interval with slider
-        interval_frame = ttk.Frame(scan_frame)
-        interval_frame.pack(fill=tk.X, pady=2)
-        
-        ttk.Label(interval_frame, text="Scan Interval:", width=12).pack(side=tk.LEFT)
-        
-        # Create a frame for the slider and value display
-        scan_slider_frame = ttk.Frame(interval_frame)
-        scan_slider_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        # Create a variable to hold the slider value
-        self.scan_interval_var = tk.DoubleVar(value=0.5)
-        
-        # Create the slider
-        self.scan_interval = ttk.Scale(
-            scan_slider_frame, 
-            from_=0.1, 
-            to=2.0, 
-            orient=tk.HORIZONTAL, 
-            variable=self.scan_interval_var,
-            command=self._update_scan_label
-        )
-        self.scan_interval.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
-        
-        # Create a label to display the current value
-        self.scan_value_label = ttk.Label(scan_slider_frame, text="0.5s", width=5)
-        self.scan_value_label.pack(side=tk.LEFT)
+        slider_grid = self._create_slider_grid(scan_frame)
+        self.scan_interval = self._create_slider_row(
+            slider_grid, 0, "Scan Interval:", "scan_interval_var")
         
         # Potion cooldown with slider
-        cooldown_frame = ttk.Frame(scan_frame)
-        cooldown_frame.pack(fill=tk.X, pady=2)
-        
-        ttk.Label(cooldown_frame, text="Potion Cooldown:", width=12).pack(side=tk.LEFT)
-        
-        # Create a frame for the slider and value display
-        cooldown_slider_frame = ttk.Frame(cooldown_frame)
-        cooldown_slider_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        # Create a variable to hold the slider value
-        self.potion_cooldown_var = tk.DoubleVar(value=3.0)
-        
-        # Create the slider
-        self.potion_cooldown = ttk.Scale(
-            cooldown_slider_frame, 
-            from_=1.0, 
-            to=10.0, 
-            orient=tk.HORIZONTAL, 
-            variable=self.potion_cooldown_var,
-            command=self._update_cooldown_label
-        )
-        self.potion_cooldown.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
-        
-        # Create a label to display the current value
-        self.cooldown_value_label = ttk.Label(cooldown_slider_frame, text="3.0s", width=5)
-        self.cooldown_value_label.pack(side=tk.LEFT)
+        self.potion_cooldown = self._create_slider_row(
+            slider_grid, 1, "Potion Cooldown:", "potion_cooldown_var")
         
         # Debug options
         debug_frame = ttk.LabelFrame(parent, text="Debug Options", padding=5)
         debug_frame.pack(fill=tk.X, pady=5, padx=5)
         
         # Debug mode
-        self.debug_var = tk.BooleanVar(value=True)
         debug_check = ttk.Checkbutton(
             debug_frame, 
             text="Enable Debug Mode (saves screenshots and logs extra information)", 
@@ -475,105 +469,97 @@ class SettingsUI:
         )
         debug_check.pack(anchor=tk.W, pady=5)
     
-    def _update_scan_label(self, value):
-        """Update the scan interval label when the slider is moved"""
-        # Round to 1 decimal place
-        value = round(float(value), 1)
-        self.scan_value_label.config(text=f"{value}s")
+    def get_settings(self):
+        """
+        Get current settings as a dictionary
+        
+        The dictionary is rebuilt only after a setting changes and is shared
+        between callers until then, so it must not be modified.
+        
+        Returns:
+            Settings dictionary
+        """
+        if self._settings_dirty:
+            self._refresh_settings()
+        return self._settings_cache
     
-    def _update_cooldown_label(self, value):
-        """Update the potion cooldown label when the slider is moved"""
-        # Round to 1 decimal place
-        value = round(float(value), 1)
-        self.cooldown_value_label.config(text=f"{value}s")
+    @property
+    def settings_version(self):
+        """Version of the last published settings, safe to read from the bot thread"""
+        return self._settings_version
     
-    def get_settings(self):
-        """Get current settings as a dictionary"""
+    def get_published_settings(self):
+        """
+        Get the settings as last rebuilt on the UI thread, without touching Tk
+        
+        Safe to call from the bot thread; changes show up here once the UI
+        thread is idle.
+        
+        Returns:
+            (version, settings dictionary) tuple
+        """
+        return self._published_settings
+    
+    def _build_settings(self):
+        """Read every setting from the Tk variables into a new dictionary"""
         settings = {
-            "thresholds": {
-                "health": float(self.hp_threshold_var.get()),
-                "mana": float(self.mp_threshold_var.get()),
-                "stamina": float(self.sp_threshold_var.get())
-            },
-            "potion_keys": {
-                "health": self.hp_key.get(),
-                "mana": self.mp_key.get(),
-                "stamina": self.sp_key.get()
-            },
-            "spellcasting": {
-                "enabled": self.spellcast_enabled.get(),
-                "spell_key": self.spell_key.get(),
-                "spell_interval": float(self.spell_interval_var.get()),
-                "use_target_zone": self.use_target_zone_var.get(),
-                "target_points_count": int(self.target_points_var.get()),
-                "target_zone": {}
-            },
-            "scan_interval": float(self.scan_interval_var.get()),
-            "potion_cooldown": float(self.potion_cooldown_var.get()),
-            "debug_enabled": self.debug_var.get()
+            "thresholds": {},
+            "potion_keys": {},
+            "spellcasting": {"target_zone": {}}
         }
+        for section, key, attr, _, _ in _SETTINGS_SCHEMA:
+            target = settings[section] if section else settings
+            target[key] = getattr(self, attr).get()
         
         # Add target zone if available
-        if hasattr(self, 'target_zone_selector') and self.target_zone_selector and self.target_zone_selector.is_setup():
+        zone = self.target_zone_selector
+        if zone is not None and zone.is_setup():
             settings["spellcasting"]["target_zone"] = {
-                "x1": self.target_zone_selector.x1,
-                "y1": self.target_zone_selector.y1,
-                "x2": self.target_zone_selector.x2,
-                "y2": self.target_zone_selector.y2,
-                "points": self.target_zone_selector.get_serializable_points()
+                "x1": zone.x1,
+                "y1": zone.y1,
+                "x2": zone.x2,
+                "y2": zone.y2,
+                "points": zone.get_serializable_points()
             }
         
         return settings
     
+    def set_settings_when_idle(self, settings):
+        """
+        Apply settings from a dictionary once the UI is idle
+        
+        Lets startup draw the window before the saved values are written to
+        the widgets.
+        
+        Args:
+            settings: Settings dictionary, as for set_settings
+        """
+        self.parent.after_idle(self.set_settings, settings)
+    
     def set_settings(self, settings):
         """Set settings from a dictionary"""
-        # Thresholds
-        thresholds = settings.get("thresholds", {})
-        self.hp_threshold_var.set(thresholds.get("health", 50))
-        self.mp_threshold_var.set(thresholds.get("mana", 30))
-        self.sp_threshold_var.set(thresholds.get("stamina", 40))
-        
-        # Update labels
-        self._update_hp_label(self.hp_threshold_var.get())
-        self._update_mp_label(self.mp_threshold_var.get())
-        self._update_sp_label(self.sp_threshold_var.get())
-        
-        # Potion keys
-        potion_keys = settings.get("potion_keys", {})
-        self.hp_key.set(potion_keys.get("health", "1"))
-        self.mp_key.set(potion_keys.get("mana", "3"))
-        self.sp_key.set(potion_keys.get("stamina", "2"))
-        
-        # Spellcasting
-        spellcasting = settings.get("spellcasting", {})
-        self.spellcast_enabled.set(spellcasting.get("enabled", False))
-        self.spell_key.set(spellcasting.get("spell_key", "F1"))
-        self.spell_interval_var.set(spellcasting.get("spell_interval", 1.2))
-        self._update_interval_label(self.spell_interval_var.get())
-        
-        # Target zone
-        self.use_target_zone_var.set(spellcasting.get("use_target_zone", True))
-        self.target_points_var.set(spellcasting.get("target_points_count", 8))
-        self._update_points_label(self.target_points_var.get())
+        for section, key, attr, _, default in _SETTINGS_SCHEMA:
+            source = settings.get(section, _EMPTY) if section else settings
+            _set_if_changed(getattr(self, attr), source.get(key, default))
         
         # Target zone settings
-        if "target_zone" in spellcasting and spellcasting["target_zone"]:
-            target_zone = spellcasting["target_zone"]
-            
+        target_zone = settings.get("spellcasting", _EMPTY).get("target_zone")
+        if target_zone:
             # Check if we have all needed coordinates
-            if all(k in target_zone for k in ["x1", "y1", "x2", "y2"]):
+            if all(k in target_zone for k in ("x1", "y1", "x2", "y2")):
                 # Create a target zone selector and configure it
                 from app.target_zone_selector import TargetZoneSelector
                 self.target_zone_selector = TargetZoneSelector(self.parent.winfo_toplevel())
                 
                 # Configure with points if they're available
-                if "points" in target_zone and target_zone["points"]:
+                points = target_zone.get("points")
+                if points:
                     self.target_zone_selector.configure_from_saved(
                         target_zone["x1"],
                         target_zone["y1"],
                         target_zone["x2"],
                         target_zone["y2"],
-                        target_zone["points"]
+                        points
                     )
                 else:
                     self.target_zone_selector.configure_from_saved(
@@ -584,17 +570,9 @@ class SettingsUI:
                     )
                 
                 # Update status
-                self.target_zone_var.set(f"Configured ({len(self.target_zone_selector.target_points)} points)")
+                _set_if_changed(self.target_zone_var, f"Configured ({len(self.target_zone_selector.target_points)} points)")
+                self._on_setting_changed()
             else:
-                self.target_zone_var.set("Not Configured")
+                _set_if_changed(self.target_zone_var, "Not Configured")
         else:
-            self.target_zone_var.set("Not Configured")
-        
-        # Other settings
-        self.scan_interval_var.set(settings.get("scan_interval", 0.5))
-        self._update_scan_label(self.scan_interval_var.get())
-        
-        self.potion_cooldown_var.set(settings.get("potion_cooldown", 3.0))
-        self._update_cooldown_label(self.potion_cooldown_var.get())
-        
-        self.debug_var.set(settings.get("debug_enabled", True))
\ No newline at end of file
+            _set_if_changed(self.target_zone_var, "Not Configured")
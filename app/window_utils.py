@@ -56,6 +56,159 @@ class Input(ctypes.Structure):
         ("ii", InputI)
     ]
 
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+MOUSEEVENTF_MOVE = 0x0001
+MOUSEEVENTF_RIGHTDOWN = 0x0008
+MOUSEEVENTF_RIGHTUP = 0x0010
+MOUSEEVENTF_ABSOLUTE = 0x8000
+
+# Shared extra info and INPUT records built once, so clicks and key presses
+# don't allocate fresh ctypes structures on every call
+_EXTRA = ctypes.c_ulong(0)
+_EXTRA_P = ctypes.pointer(_EXTRA)
+_INPUT_SIZE = ctypes.sizeof(Input)
+
+# Reused out-parameter for GetCursorPos
+_CURSOR_POINT = wintypes.POINT()
+
+# user32 input entry points resolved once with declared prototypes, on a private
+# DLL instance so the prototypes don't leak into other ctypes.windll users
+_user32 = ctypes.WinDLL('user32', use_last_error=True)
+
+_SendInput = _user32.SendInput
+_SendInput.argtypes = (wintypes.UINT, ctypes.POINTER(Input), ctypes.c_int)
+_SendInput.restype = wintypes.UINT
+_SetCursorPos = _user32.SetCursorPos
+_SetCursorPos.argtypes = (ctypes.c_int, ctypes.c_int)
+_SetCursorPos.restype = wintypes.BOOL
+_mouse_event = _user32.mouse_event
+_mouse_event.argtypes = (wintypes.DWORD, wintypes.DWORD, wintypes.DWORD, wintypes.DWORD, ctypes.c_size_t)
+_mouse_event.restype = None
+_keybd_event = _user32.keybd_event
+# Win32 BYTE is unsigned; wintypes.BYTE is a signed c_byte
+_keybd_event.argtypes = (ctypes.c_ubyte, ctypes.c_ubyte, wintypes.DWORD, ctypes.c_size_t)
+_keybd_event.restype = None
+_GetSystemMetrics = _user32.GetSystemMetrics
+_GetSystemMetrics.argtypes = (ctypes.c_int,)
+_GetSystemMetrics.restype = ctypes.c_int
+_GetCursorPos = _user32.GetCursorPos
+_GetCursorPos.argtypes = (ctypes.POINTER(wintypes.POINT),)
+_GetCursorPos.restype = wintypes.BOOL
+_InternalGetWindowText = _user32.InternalGetWindowText
+_InternalGetWindowText.argtypes = (wintypes.HWND, wintypes.LPWSTR, ctypes.c_int)
+_InternalGetWindowText.restype = ctypes.c_int
+_GetWindowThreadProcessId = _user32.GetWindowThreadProcessId
+_GetWindowThreadProcessId.argtypes = (wintypes.HWND, ctypes.POINTER(wintypes.DWORD))
+_GetWindowThreadProcessId.restype = wintypes.DWORD
+_AttachThreadInput = _user32.AttachThreadInput
+_AttachThreadInput.argtypes = (wintypes.DWORD, wintypes.DWORD, wintypes.BOOL)
+_AttachThreadInput.restype = wintypes.BOOL
+_SystemParametersInfoW = _user32.SystemParametersInfoW
+_SystemParametersInfoW.argtypes = (wintypes.UINT, wintypes.UINT, ctypes.c_void_p, wintypes.UINT)
+_SystemParametersInfoW.restype = wintypes.BOOL
+_GetCurrentThreadId = ctypes.WinDLL('kernel32', use_last_error=True).GetCurrentThreadId
+_GetCurrentThreadId.argtypes = ()
+_GetCurrentThreadId.restype = wintypes.DWORD
+_VkKeyScanW = _user32.VkKeyScanW
+_VkKeyScanW.argtypes = (wintypes.WCHAR,)
+_VkKeyScanW.restype = ctypes.c_short
+
+def _mouse_input(flags, dx=0, dy=0):
+    """
+    Build a mouse INPUT record for SendInput
+    
+    Args:
+        flags: MOUSEEVENTF_* flags
+        dx: X coordinate or movement
+        dy: Y coordinate or movement
+        
+    Returns:
+        Input structure
+    """
+    ii_ = InputI()
+    ii_.mi = MouseInput(dx, dy, 0, flags, 0, _EXTRA_P)
+    return Input(INPUT_MOUSE, ii_)
+
+def _key_input(vk_code, flags=0):
+    """
+    Build a keyboard INPUT record for SendInput
+    
+    Args:
+        vk_code: Virtual key code
+        flags: KEYEVENTF_* flags
+        
+    Returns:
+        Input structure
+    """
+    ii_ = InputI()
+    ii_.ki = KeyBdInput(vk_code, 0, flags, 0, _EXTRA_P)
+    return Input(INPUT_KEYBOARD, ii_)
+
+# Down and up records live side by side in one array so a press with no gap
+# can be submitted in a single SendInput call
+_INPUT_PAIR = Input * 2
+
+_RIGHT_CLICK_INPUTS = _INPUT_PAIR(_mouse_input(MOUSEEVENTF_RIGHTDOWN), _mouse_input(MOUSEEVENTF_RIGHTUP))
+_RIGHT_DOWN_INPUT, _RIGHT_UP_INPUT = _RIGHT_CLICK_INPUTS
+
+# (key down, key up) INPUT record pairs per virtual key code, built on first use
+_KEY_INPUTS = {}
+
+def _get_key_inputs(vk_code):
+    """
+    Get the prebuilt key down and key up INPUT records for a key
+    
+    Args:
+        vk_code: Virtual key code
+        
+    Returns:
+        Two-element Input array holding key down and key up
+    """
+    inputs = _KEY_INPUTS.get(vk_code)
+    if inputs is None:
+        inputs = _KEY_INPUTS[vk_code] = _INPUT_PAIR(_key_input(vk_code), _key_input(vk_code, KEYEVENTF_KEYUP))
+    return inputs
+
+
+# Gap between the down and up events of a key press or click. The game drops
+# presses that arrive back to back, so keep this at 0.05 unless the target
+# is known to accept shorter gaps
+_CLICK_DELAY = 0.05
+
+def _precise_wait(seconds):
+    """
+    Wait for a short interval
+    
+    Args:
+        seconds: Time to wait; intervals under 2ms are busy-waited because
+            time.sleep can't resolve them on Windows
+    """
+    if seconds >= 0.002:
+        time.sleep(seconds)
+        return
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+# Virtual key codes for the key names used in the settings
+_VK_MAP = {
+    '1': 0x31, '2': 0x32, '3': 0x33, '4': 0x34, '5': 0x35,
+    '6': 0x36, '7': 0x37, '8': 0x38, '9': 0x39, '0': 0x30,
+    'a': 0x41, 'b': 0x42, 'c': 0x43, 'd': 0x44, 'e': 0x45,
+    'f': 0x46, 'g': 0x47, 'h': 0x48, 'i': 0x49, 'j': 0x4A,
+    'k': 0x4B, 'l': 0x4C, 'm': 0x4D, 'n': 0x4E, 'o': 0x4F,
+    'p': 0x50, 'q': 0x51, 'r': 0x52, 's': 0x53, 't': 0x54,
+    'u': 0x55, 'v': 0x56, 'w': 0x57, 'x': 0x58, 'y': 0x59, 'z': 0x5A,
+    'space': 0x20, 'enter': 0x0D, 'tab': 0x09, 'esc': 0x1B,
+    'backspace': 0x08, 'delete': 0x2E, 'insert': 0x2D,
+    'home': 0x24, 'end': 0x23, 'pageup': 0x21, 'pagedown': 0x22,
+    'left': 0x25, 'up': 0x26, 'right': 0x27, 'down': 0x28,
+    'f1': 0x70, 'f2': 0x71, 'f3': 0x72, 'f4': 0x73,
+    'f5': 0x74, 'f6': 0x75, 'f7': 0x76, 'f8': 0x77,
+    'f9': 0x78, 'f10': 0x79, 'f11': 0x7A, 'f12': 0x7B
+}
 
 def get_virtual_key_code(key):
     """
@@ -67,88 +220,79 @@ def get_virtual_key_code(key):
     Returns:
         Virtual key code
     """
-    # Map common keys to virtual key codes
-    key_map = {
-        '1': 0x31, '2': 0x32, '3': 0x33, '4': 0x34, '5': 0x35,
-        '6': 0x36, '7': 0x37, '8': 0x38, '9': 0x39, '0': 0x30,
-        'a': 0x41, 'b': 0x42, 'c': 0x43, 'd': 0x44, 'e': 0x45,
-        'f': 0x46, 'g': 0x47, 'h': 0x48, 'i': 0x49, 'j': 0x4A,
-        'k': 0x4B, 'l': 0x4C, 'm': 0x4D, 'n': 0x4E, 'o': 0x4F,
-        'p': 0x50, 'q': 0x51, 'r': 0x52, 's': 0x53, 't': 0x54,
-        'u': 0x55, 'v': 0x56, 'w': 0x57, 'x': 0x58, 'y': 0x59, 'z': 0x5A,
-        'space': 0x20, 'enter': 0x0D, 'tab': 0x09, 'esc': 0x1B,
-        'backspace': 0x08, 'delete': 0x2E, 'insert': 0x2D,
-        'home': 0x24, 'end': 0x23, 'pageup': 0x21, 'pagedown': 0x22,
-        'left': 0x25, 'up': 0x26, 'right': 0x27, 'down': 0x28,
-        'f1': 0x70, 'f2': 0x71, 'f3': 0x72, 'f4': 0x73,
-        'f5': 0x74, 'f6': 0x75, 'f7': 0x76, 'f8': 0x77,
-        'f9': 0x78, 'f10': 0x79, 'f11': 0x7A, 'f12': 0x7B
-    }
-    
     # Convert key to lowercase
     key = key.lower() if isinstance(key, str) else str(key)
     
     # Look up key in map
-    if key in key_map:
-        return key_map[key]
+    vk_code = _VK_MAP.get(key)
+    if vk_code is not None:
+        return vk_code
     
-    # Use ASCII value as fallback
-    logger.warning(f"Key '{key}' not found in key map, using ASCII value")
+    # Ask the current keyboard layout for the first character as fallback
+    logger.warning(f"Key '{key}' not found in key map, using keyboard layout")
     try:
-        return ord(key.upper()[0])
-    except:
-        logger.error(f"Could not determine virtual key code for '{key}'")
-        return 0
+        result = _VkKeyScanW(key[0])
+        if result != -1:
+            return result & 0xFF
+    except Exception:
+        pass
+    logger.error(f"Could not determine virtual key code for '{key}'")
+    return 0
 
-def press_key(hwnd, key):
+def press_key(hwnd, key, delay=None, blocking=False):
     """
     Press a key, either in a specific window or using SendInput globally
     
     Args:
         hwnd: Window handle or None to use SendInput
         key: Key to press
+        delay: Seconds between key down and key up (defaults to _CLICK_DELAY)
+        blocking: With a window handle, wait for the window to process each
+            message (SendMessage) instead of queueing it (PostMessage)
         
     Returns:
         True if successful, False otherwise
     """
+    if delay is None:
+        delay = _CLICK_DELAY
     try:
         vk_code = get_virtual_key_code(key)
         
         # If hwnd is provided, send message to that window
         if hwnd:
-            window_title = win32gui.GetWindowText(hwnd)
-            logger.info(f"Sending key '{key}' (VK: {vk_code}) to window '{window_title}'")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Sending key '{key}' (VK: {vk_code}) to window '{win32gui.GetWindowText(hwnd)}'")
+            
+            # Queue the messages unless the caller needs them processed first
+            send = win32api.SendMessage if blocking else win32gui.PostMessage
             
             # Send key down message
-            win32api.SendMessage(hwnd, win32con.WM_KEYDOWN, vk_code, 0)
-            time.sleep(0.05)  # Small delay between down and up
+            send(hwnd, win32con.WM_KEYDOWN, vk_code, 0)
+            _precise_wait(delay)  # Small delay between down and up
             
             # Send key up message
-            win32api.SendMessage(hwnd, win32con.WM_KEYUP, vk_code, 0)
+            send(hwnd, win32con.WM_KEYUP, vk_code, 0)
         else:
             # Use SendInput (works for both focused and background windows)
-            logger.info(f"Sending key '{key}' (VK: {vk_code}) using SendInput")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Sending key '{key}' (VK: {vk_code}) using SendInput")
+            key_inputs = _get_key_inputs(vk_code)
             
-            # Define constants
-            INPUT_KEYBOARD = 1
-            KEYEVENTF_KEYUP = 0x0002
+            # Without a gap, submit down and up together
+            if not delay:
+                _SendInput(2, key_inputs, _INPUT_SIZE)
+                return True
+            
+            key_down, key_up = key_inputs
             
             # Key down
-            extra = ctypes.c_ulong(0)
-            ii_ = InputI()
-            ii_.ki = KeyBdInput(vk_code, 0, 0, 0, ctypes.pointer(extra))
-            x = Input(INPUT_KEYBOARD, ii_)  # INPUT_KEYBOARD = 1
-            ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+            _SendInput(1, ctypes.byref(key_down), _INPUT_SIZE)
             
             # Small delay
-            time.sleep(0.05)
+            _precise_wait(delay)
             
             # Key up
-            extra = ctypes.c_ulong(0)
-            ii_ = InputI()
-            ii_.ki = KeyBdInput(vk_code, 0, KEYEVENTF_KEYUP, 0, ctypes.pointer(extra))
-            x = Input(INPUT_KEYBOARD, ii_)
-            ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+            _SendInput(1, ctypes.byref(key_up), _INPUT_SIZE)
             
         return True
     except Exception as e:
@@ -249,10 +393,10 @@ def test_click_methods(hwnd=None):
         MOUSEEVENTF_RIGHTUP = 0x0010
         
         # Mouse down
-        ctypes.windll.user32.mouse_event(MOUSEEVENTF_RIGHTDOWN, 0, 0, 0, 0)
+        _mouse_event(MOUSEEVENTF_RIGHTDOWN, 0, 0, 0, 0)
         time.sleep(0.05)
         # Mouse up
-        ctypes.windll.user32.mouse_event(MOUSEEVENTF_RIGHTUP, 0, 0, 0, 0)
+        _mouse_event(MOUSEEVENTF_RIGHTUP, 0, 0, 0, 0)
         
         logger.info("Method 3 completed without errors")
         results["mouse_event"] = "Completed"
@@ -273,7 +417,7 @@ def test_click_methods(hwnd=None):
         ii_ = InputI()
         ii_.mi = MouseInput(0, 0, 0, MOUSEEVENTF_RIGHTDOWN, 0, ctypes.pointer(extra))
         x = Input(INPUT_MOUSE, ii_)
-        ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+        _SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
         
         time.sleep(0.05)
         
@@ -282,7 +426,7 @@ def test_click_methods(hwnd=None):
         ii_ = InputI()
         ii_.mi = MouseInput(0, 0, 0, MOUSEEVENTF_RIGHTUP, 0, ctypes.pointer(extra))
         x = Input(INPUT_MOUSE, ii_)
-        ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+        _SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
         
         logger.info("Method 4 completed without errors")
         results["SendInput_MOUSEINPUT"] = "Completed"
@@ -306,17 +450,17 @@ def test_click_methods(hwnd=None):
             target_y = top + (bottom - top) // 2
         
         # Move cursor
-        ctypes.windll.user32.SetCursorPos(target_x, target_y)
+        _SetCursorPos(target_x, target_y)
         
         # Click
         MOUSEEVENTF_RIGHTDOWN = 0x0008
         MOUSEEVENTF_RIGHTUP = 0x0010
-        ctypes.windll.user32.mouse_event(MOUSEEVENTF_RIGHTDOWN, 0, 0, 0, 0)
+        _mouse_event(MOUSEEVENTF_RIGHTDOWN, 0, 0, 0, 0)
         time.sleep(0.05)
-        ctypes.windll.user32.mouse_event(MOUSEEVENTF_RIGHTUP, 0, 0, 0, 0)
+        _mouse_event(MOUSEEVENTF_RIGHTUP, 0, 0, 0, 0)
         
         # Restore cursor position
-        ctypes.windll.user32.SetCursorPos(original_x, original_y)
+        _SetCursorPos(original_x, original_y)
         
         logger.info("Method 5 completed without errors")
         results["SetCursorPos_mouse_event"] = "Completed"
@@ -329,8 +473,8 @@ def test_click_methods(hwnd=None):
         logger.info("Method 6: SendInput with absolute coordinates")
         
         # Get screen dimensions for coordinate conversion
-        screen_width = ctypes.windll.user32.GetSystemMetrics(0)
-        screen_height = ctypes.windll.user32.GetSystemMetrics(1)
+        screen_width = _GetSystemMetrics(0)
+        screen_height = _GetSystemMetrics(1)
         
         # Calculate position
         target_x, target_y = screen_width // 2, screen_height // 2
@@ -354,7 +498,7 @@ def test_click_methods(hwnd=None):
         ii_ = InputI()
         ii_.mi = MouseInput(norm_x, norm_y, 0, MOUSEEVENTF_ABSOLUTE | MOUSEEVENTF_MOVE, 0, ctypes.pointer(extra))
         x = Input(INPUT_MOUSE, ii_)
-        ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+        _SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
         
         time.sleep(0.05)
         
@@ -363,7 +507,7 @@ def test_click_methods(hwnd=None):
         ii_ = InputI()
         ii_.mi = MouseInput(0, 0, 0, MOUSEEVENTF_RIGHTDOWN, 0, ctypes.pointer(extra))
         x = Input(INPUT_MOUSE, ii_)
-        ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+        _SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
         
         time.sleep(0.05)
         
@@ -372,7 +516,7 @@ def test_click_methods(hwnd=None):
         ii_ = InputI()
         ii_.mi = MouseInput(0, 0, 0, MOUSEEVENTF_RIGHTUP, 0, ctypes.pointer(extra))
         x = Input(INPUT_MOUSE, ii_)
-        ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+        _SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
         
         logger.info("Method 6 completed without errors")
         results["SendInput_Absolute"] = "Completed"
@@ -391,16 +535,16 @@ def test_click_methods(hwnd=None):
         KEYEVENTF_KEYUP = 0x0002
         
         # Press Right Control
-        ctypes.windll.user32.keybd_event(VK_RCONTROL, 0, 0, 0)
+        _keybd_event(VK_RCONTROL, 0, 0, 0)
         time.sleep(0.05)
         # Press Right Alt
-        ctypes.windll.user32.keybd_event(VK_RMENU, 0, 0, 0)
+        _keybd_event(VK_RMENU, 0, 0, 0)
         time.sleep(0.05)
         # Release Right Alt
-        ctypes.windll.user32.keybd_event(VK_RMENU, 0, KEYEVENTF_KEYUP, 0)
+        _keybd_event(VK_RMENU, 0, KEYEVENTF_KEYUP, 0)
         time.sleep(0.05)
         # Release Right Control
-        ctypes.windll.user32.keybd_event(VK_RCONTROL, 0, KEYEVENTF_KEYUP, 0)
+        _keybd_event(VK_RCONTROL, 0, KEYEVENTF_KEYUP, 0)
         
         logger.info("Method 7 completed without errors")
         results["DirectInput_KeyCombination"] = "Completed"
@@ -415,164 +559,37 @@ def test_click_methods(hwnd=None):
     
     return results
 
-def press_right_mouse(hwnd=None, target_x=None, target_y=None, method=None):
+# Last window found per searched name, reused while it still exists and matches
+_LAST_HWND = {}
+
+def _get_window_title(hwnd, buffer):
     """
-    Try specific or all mouse click methods to simulate a right-click
+    Read a window title without sending WM_GETTEXT to its owner
     
-    Args:
-        hwnd: Window handle or None
-        method: Specific method to use, or None to try all methods
+    InternalGetWindowText copies the title the system already stores for the
+    window, so a hung application can't stall a window enumeration.
     
+    Args:
+        hwnd: Window handle
+        buffer: Unicode buffer from ctypes.create_unicode_buffer, reused across calls
+        
     Returns:
-        True if at least one method worked, False otherwise
+        Window title, or an empty string if it has none
     """
-    # Make sure to import the logger at the beginning of the function
-    logger = logging.getLogger('PristonBot')
-    logger.debug(f"Entered press_right_mouse function with target: ({target_x}, {target_y})")
-    success = False
+    if _InternalGetWindowText(hwnd, buffer, len(buffer)):
+        return buffer.value
+    return ""
 
-    # Store original cursor position if we're moving it
-    original_pos = None
-    if target_x is not None and target_y is not None:
-        try:
-            cursor_info = win32gui.GetCursorInfo()
-            original_pos = cursor_info[2]  # (x, y) tuple
-            logger.debug(f"Saved original cursor position: {original_pos}")
-        except Exception as e:
-            logger.warning(f"Could not get original cursor position: {e}")
-    
-    try:
-        # Move cursor to target position if specified
-        if target_x is not None and target_y is not None:
-            logger.debug(f"Moving cursor to position ({target_x}, {target_y})")
-            ctypes.windll.user32.SetCursorPos(int(target_x), int(target_y))
-            # Ensure the cursor has moved before continuing
-            time.sleep(0.1)
-        
-        # Try direct approach with SendInput for the right click
-        try:
-            logger.info(f"Clicking at position ({target_x}, {target_y}) with SendInput")
-            
-            # Define constants
-            INPUT_MOUSE = 0
-            MOUSEEVENTF_RIGHTDOWN = 0x0008
-            MOUSEEVENTF_RIGHTUP = 0x0010
-            
-            # Mouse down
-            extra = ctypes.c_ulong(0)
-            ii_ = InputI()
-            ii_.mi = MouseInput(0, 0, 0, MOUSEEVENTF_RIGHTDOWN, 0, ctypes.pointer(extra))
-            x = Input(INPUT_MOUSE, ii_)
-            ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
-            
-            # Small delay between down and up
-            time.sleep(0.1)
-            
-            # Mouse up
-            extra = ctypes.c_ulong(0)
-            ii_ = InputI()
-            ii_.mi = MouseInput(0, 0, 0, MOUSEEVENTF_RIGHTUP, 0, ctypes.pointer(extra))
-            x = Input(INPUT_MOUSE, ii_)
-            ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
-            
-            success = True
-            
-        except Exception as e:
-            logger.error(f"Error with SendInput click: {e}", exc_info=True)
-            
-            # Try alternative method with mouse_event
-            try:
-                logger.info("Attempting mouse_event as fallback")
-                MOUSEEVENTF_RIGHTDOWN = 0x0008
-                MOUSEEVENTF_RIGHTUP = 0x0010
-                
-                ctypes.windll.user32.mouse_event(MOUSEEVENTF_RIGHTDOWN, 0, 0, 0, 0)
-                time.sleep(0.1)
-                ctypes.windll.user32.mouse_event(MOUSEEVENTF_RIGHTUP, 0, 0, 0, 0)
-                
-                success = True
-            except Exception as e2:
-                logger.error(f"Error with mouse_event click: {e2}", exc_info=True)
-                success = False
-        
-        if not success:
-            logger.error("All click methods failed!")
-        
-        return success
-        
-    finally:
-        # Restore original cursor position if we moved it and the setting requires it
-        # You can add a setting to control whether to restore the cursor position
-        if original_pos is not None:
-            # Wait slightly longer before restoring position to ensure click is registered
-            time.sleep(0.2)
-            logger.debug(f"Restoring cursor to original position: {original_pos}")
-            ctypes.windll.user32.SetCursorPos(original_pos[0], original_pos[1])
+def _forget_window(hwnd):
     """
-    Try specific or all mouse click methods to simulate a right-click
+    Drop a window from the find_game_window cache
     
     Args:
-        hwnd: Window handle or None
-        method: Specific method to use, or None to try all methods
-    
-    Returns:
-        True if at least one method worked, False otherwise
+        hwnd: Window handle
     """
-    logger = logging.getLogger('PristonBot')
-    logger.debug("Entered press_right_mouse function")
-    success = False
-
-    # Dictionary of available methods
-    click_methods = {
-        "SendInput": lambda: _click_method_send_input(),
-        "SendInputAbsolute": lambda: _click_method_send_input_absolute(hwnd)
-    }
-    
-    # If a specific method is requested
-    if method and method in click_methods:
-        try:
-            logger.info(f"Attempting click method: {method}")
-            success = click_methods[method]()
-            logger.info(f"Click method {method} " + ("succeeded" if success else "failed"))
-            return success
-        except Exception as e:
-            logger.error(f"Error with click method {method}: {e}", exc_info=True)
-            return False
-    
-    # Try methods in order (most likely to work first)
-    methods_to_try = [
-        "SendInput"          # Most reliable cross-application
-    ]
-    
-    # Add window-specific methods if we have a window handle
-    if hwnd:
-        methods_to_try = ["PostMessage", "SendMessage"] + methods_to_try
-    
-    # Try each method until one succeeds
-    for method_name in methods_to_try:
-        try:
-            logger.info(f"Attempting click method: {method_name}")
-            if click_methods[method_name]():
-                logger.info(f"Click method {method_name} succeeded")
-                success = True
-                break
-            else:
-                logger.warning(f"Click method {method_name} failed")
-        except Exception as e:
-            logger.warning(f"Error with click method {method_name}: {e}")
-    
-    # Last resort: try key combination
-    if not success:
-        try:
-            logger.info("Attempting keyboard shortcut as last resort")
-            success = click_methods["KeyCombination"]()
-            logger.info(f"Key combination method " + ("succeeded" if success else "failed"))
-        except Exception as e:
-            logger.warning(f"Error with key combination method: {e}")
-    
-    if not success:
-        logger.error("All click methods failed!")
-    return success
+    for window_name, cached_hwnd in list(_LAST_HWND.items()):
+        if cached_hwnd == hwnd:
+            del _LAST_HWND[window_name]
 
 def find_game_window(window_name="Priston Tale"):
     """
@@ -584,36 +601,103 @@ def find_game_window(window_name="Priston Tale"):
     Returns:
         Window handle if found, None otherwise
     """
+    needle = window_name.casefold()
+    
+    # Reuse the previous result while that window is still around
+    hwnd = _LAST_HWND.get(window_name)
+    if (hwnd and win32gui.IsWindow(hwnd) and win32gui.IsWindowVisible(hwnd)
+            and needle in win32gui.GetWindowText(hwnd).casefold()):
+        return hwnd
+    
     logger.info(f"Searching for game window: {window_name}")
     
     # Try direct match first
     hwnd = win32gui.FindWindow(None, window_name)
     if hwnd != 0:
         logger.info(f"Found exact window match with handle {hwnd}")
+        _LAST_HWND[window_name] = hwnd
         return hwnd
     
-    # If not found, try partial match
+    # If not found, try partial match, stopping at the first hit
     windows = []
+    title_buffer = ctypes.create_unicode_buffer(256)
     def callback(hwnd, windows):
-        if win32gui.IsWindowVisible(hwnd) and win32gui.IsWindow(hwnd):
-            title = win32gui.GetWindowText(hwnd)
-            if window_name.lower() in title.lower():
+        if win32gui.IsWindowVisible(hwnd):
+            title = _get_window_title(hwnd, title_buffer)
+            if needle in title.casefold():
                 windows.append((hwnd, title))
+                return False
         return True
     
-    win32gui.EnumWindows(callback, windows)
+    try:
+        win32gui.EnumWindows(callback, windows)
+    except win32gui.error:
+        # Stopping the enumeration early is reported as a failure by some pywin32 versions
+        if not windows:
+            raise
     
     if windows:
         logger.info(f"Found similar window: '{windows[0][1]}' with handle {windows[0][0]}")
+        _LAST_HWND[window_name] = windows[0][0]
         return windows[0][0]
     
     logger.warning(f"Game window '{window_name}' not found")
     return None
 
+def _focus_plain(hwnd):
+    """Standard SetForegroundWindow"""
+    win32gui.SetForegroundWindow(hwnd)
+
+def _focus_attach_thread_input(hwnd):
+    """SetForegroundWindow while attached to the foreground thread's input"""
+    foreground_thread = _GetWindowThreadProcessId(win32gui.GetForegroundWindow(), None)
+    current_thread = _GetCurrentThreadId()
+    
+    # Attach threads
+    _AttachThreadInput(foreground_thread, current_thread, True)
+    try:
+        # Show and focus window
+        win32gui.ShowWindow(hwnd, win32con.SW_SHOW)
+        win32gui.SetForegroundWindow(hwnd)
+    finally:
+        # Detach threads
+        _AttachThreadInput(foreground_thread, current_thread, False)
+
+def _focus_lock_timeout(hwnd):
+    """SetForegroundWindow with the foreground lock timeout briefly set to 0"""
+    SPI_GETFOREGROUNDLOCKTIMEOUT = 0x2000
+    SPI_SETFOREGROUNDLOCKTIMEOUT = 0x2001
+    SPIF_SENDCHANGE = 0x2
+    
+    # Save current timeout
+    timeout_buf = wintypes.DWORD(0)
+    _SystemParametersInfoW(SPI_GETFOREGROUNDLOCKTIMEOUT, 0, ctypes.byref(timeout_buf), 0)
+    
+    # Set timeout to 0
+    _SystemParametersInfoW(SPI_SETFOREGROUNDLOCKTIMEOUT, 0, None, SPIF_SENDCHANGE)
+    try:
+        # Try to set foreground window
+        win32gui.SetForegroundWindow(hwnd)
+    finally:
+        # Restore timeout
+        # The new value is passed as the pointer argument itself
+        _SystemParametersInfoW(SPI_SETFOREGROUNDLOCKTIMEOUT, 0, timeout_buf.value, SPIF_SENDCHANGE)
+
+# Focus methods in the order focus_game_window tries them
+_FOCUS_METHODS = (
+    ("Standard SetForegroundWindow", _focus_plain),
+    ("Alternative focus method", _focus_attach_thread_input),
+    ("Final focus attempt", _focus_lock_timeout)
+)
+
 def focus_game_window(hwnd):
     """
     Bring the game window to the foreground
     
+    Only SendInput-based input needs this; key presses and clicks sent as
+    window messages (press_key with a handle, _click_method_send_message,
+    _click_method_post_message) reach the window without focus.
+    
     Args:
         hwnd: Window handle
         
@@ -625,18 +709,19 @@ def focus_game_window(hwnd):
         return False
     
     try:
-        # Get window title for logging
-        window_title = win32gui.GetWindowText(hwnd)
-        logger.info(f"Focusing window: {window_title}")
-        
-        # Check if window is already in foreground
+        # Check if window is already in foreground and not minimized
         current_foreground = win32gui.GetForegroundWindow()
-        if current_foreground == hwnd:
+        if current_foreground == hwnd and not win32gui.IsIconic(hwnd):
             logger.debug("Window already in foreground")
             return True
+        
+        # Window titles are only fetched for debug logging
+        logger.info(f"Focusing window with handle {hwnd}")
             
         # Try to bring window to foreground
-        logger.debug(f"Current foreground: {win32gui.GetWindowText(current_foreground)}, need to focus {window_title}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Current foreground: {win32gui.GetWindowText(current_foreground)}, "
+                         f"need to focus {win32gui.GetWindowText(hwnd)}")
         
         # Check if window is minimized
         if win32gui.IsIconic(hwnd):
@@ -644,63 +729,33 @@ def focus_game_window(hwnd):
             win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
             time.sleep(0.1)  # Give it time to restore
         
-        # Try multiple methods to focus the window
-        try:
-            # Standard method
-            win32gui.SetForegroundWindow(hwnd)
-        except Exception as e:
-            logger.warning(f"Standard SetForegroundWindow failed: {e}")
+        # Try each focus method until one goes through without an error
+        for description, focus_method in _FOCUS_METHODS:
             try:
-                # Alternative method using AttachThreadInput
-                foreground_thread = ctypes.windll.user32.GetWindowThreadProcessId(
-                    win32gui.GetForegroundWindow(), None)
-                current_thread = ctypes.windll.kernel32.GetCurrentThreadId()
-                
-                # Attach threads
-                ctypes.windll.user32.AttachThreadInput(foreground_thread, current_thread, True)
-                
-                # Show and focus window
-                win32gui.ShowWindow(hwnd, win32con.SW_SHOW)
-                win32gui.SetForegroundWindow(hwnd)
-                
-                # Detach threads
-                ctypes.windll.user32.AttachThreadInput(foreground_thread, current_thread, False)
-            except Exception as e2:
-                logger.error(f"Alternative focus method failed: {e2}")
-                
-                try:
-                    # Final attempt using ASFW_ANY
-                    SPI_GETFOREGROUNDLOCKTIMEOUT = 0x2000
-                    SPI_SETFOREGROUNDLOCKTIMEOUT = 0x2001
-                    SPIF_SENDCHANGE = 0x2
-                    
-                    # Save current timeout
-                    timeout_buf = wintypes.DWORD(0)
-                    ctypes.windll.user32.SystemParametersInfoW(
-                        SPI_GETFOREGROUNDLOCKTIMEOUT, 0, ctypes.byref(timeout_buf), 0)
-                    
-                    # Set timeout to 0
-                    ctypes.windll.user32.SystemParametersInfoW(
-                        SPI_SETFOREGROUNDLOCKTIMEOUT, 0, ctypes.c_void_p(0), SPIF_SENDCHANGE)
-                    
-                    # Try to set foreground window
-                    win32gui.SetForegroundWindow(hwnd)
-                    
-                    # Restore timeout
-                    ctypes.windll.user32.SystemParametersInfoW(
-                        SPI_SETFOREGROUNDLOCKTIMEOUT, 0, timeout_buf, SPIF_SENDCHANGE)
-                except Exception as e3:
-                    logger.error(f"Final focus attempt failed: {e3}")
-        
-        # Give window time to come to foreground
-        time.sleep(0.2)
+                focus_method(hwnd)
+                break
+            except Exception as e:
+                logger.warning(f"{description} failed: {e}")
         
-        # Verify window is in foreground
+        # Wait for the window to come to foreground, polling with a growing
+        # interval so a quick switch isn't held up by the full timeout
+        deadline = time.perf_counter() + 0.25
+        delay = 0.005
         new_foreground = win32gui.GetForegroundWindow()
+        while new_foreground != hwnd and time.perf_counter() < deadline:
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.02)
+            new_foreground = win32gui.GetForegroundWindow()
+        
+        # Verify window is in foreground
         if new_foreground != hwnd:
             logger.warning(f"Focus verification failed. Current foreground: {win32gui.GetWindowText(new_foreground)}")
+            _forget_window(hwnd)
             return False
         
+        # Restoring or raising the window may have moved it
+        _CENTER_LPARAMS.pop(hwnd, None)
+        
         logger.info("Window focus successful")
         return True
         
@@ -728,22 +783,48 @@ def get_window_rect(hwnd):
         logger.error(f"Error getting window rectangle: {e}")
         return None
     
+# Client-area center lParam per window as hwnd -> (time computed, lParam),
+# recomputed once it is older than _CENTER_LPARAM_TTL seconds
+_CENTER_LPARAMS = {}
+_CENTER_LPARAM_TTL = 0.5
+
+def _get_center_lparam(hwnd):
+    """
+    Get the mouse message lParam for the center of a window
+    
+    Args:
+        hwnd: Window handle
+        
+    Returns:
+        lParam with the client coordinates of the window center
+    """
+    now = time.monotonic()
+    cached = _CENTER_LPARAMS.get(hwnd)
+    if cached is not None and now - cached[0] < _CENTER_LPARAM_TTL:
+        return cached[1]
+    
+    left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+    width = right - left
+    height = bottom - top
+    center_x = left + width // 2
+    center_y = top + height // 2
+    client_coords = win32gui.ScreenToClient(hwnd, (center_x, center_y))
+    
+    # MAKELONG(x, y), with negative client coordinates wrapped to 16 bits
+    lParam = ((client_coords[1] & 0xFFFF) << 16) | (client_coords[0] & 0xFFFF)
+    _CENTER_LPARAMS[hwnd] = (now, lParam)
+    return lParam
+
+
 def _click_method_send_message(hwnd):
     """SendMessage method for window-specific clicking"""
     if not hwnd:
         return False
         
     try:
-        left, top, right, bottom = win32gui.GetWindowRect(hwnd)
-        width = right - left
-        height = bottom - top
-        center_x = left + width // 2
-        center_y = top + height // 2
-        client_coords = win32gui.ScreenToClient(hwnd, (center_x, center_y))
-        
-        lParam = win32api.MAKELONG(client_coords[0], client_coords[1])
+        lParam = _get_center_lparam(hwnd)
         win32api.SendMessage(hwnd, win32con.WM_RBUTTONDOWN, win32con.MK_RBUTTON, lParam)
-        time.sleep(0.05)
+        _precise_wait(_CLICK_DELAY)
         win32api.SendMessage(hwnd, win32con.WM_RBUTTONUP, 0, lParam)
         return True
     except Exception as e:
@@ -757,16 +838,9 @@ def _click_method_post_message(hwnd):
         return False
         
     try:
-        left, top, right, bottom = win32gui.GetWindowRect(hwnd)
-        width = right - left
-        height = bottom - top
-        center_x = left + width // 2
-        center_y = top + height // 2
-        client_coords = win32gui.ScreenToClient(hwnd, (center_x, center_y))
-        
-        lParam = win32api.MAKELONG(client_coords[0], client_coords[1])
+        lParam = _get_center_lparam(hwnd)
         win32gui.PostMessage(hwnd, win32con.WM_RBUTTONDOWN, win32con.MK_RBUTTON, lParam)
-        time.sleep(0.05)
+        _precise_wait(_CLICK_DELAY)
         win32gui.PostMessage(hwnd, win32con.WM_RBUTTONUP, 0, lParam)
         return True
     except Exception as e:
@@ -780,9 +854,9 @@ def _click_method_mouse_event():
         MOUSEEVENTF_RIGHTDOWN = 0x0008
         MOUSEEVENTF_RIGHTUP = 0x0010
         
-        ctypes.windll.user32.mouse_event(MOUSEEVENTF_RIGHTDOWN, 0, 0, 0, 0)
-        time.sleep(0.05)
-        ctypes.windll.user32.mouse_event(MOUSEEVENTF_RIGHTUP, 0, 0, 0, 0)
+        _mouse_event(MOUSEEVENTF_RIGHTDOWN, 0, 0, 0, 0)
+        _precise_wait(_CLICK_DELAY)
+        _mouse_event(MOUSEEVENTF_RIGHTUP, 0, 0, 0, 0)
         return True
     except Exception as e:
         logging.getLogger('PristonBot').debug(f"mouse_event click failed: {e}")
@@ -792,25 +866,18 @@ def _click_method_mouse_event():
 def _click_method_send_input():
     """SendInput method for global clicking"""
     try:
-        INPUT_MOUSE = 0
-        MOUSEEVENTF_RIGHTDOWN = 0x0008
-        MOUSEEVENTF_RIGHTUP = 0x0010
+        # Without a gap, submit down and up together
+        if not _CLICK_DELAY:
+            _SendInput(2, _RIGHT_CLICK_INPUTS, _INPUT_SIZE)
+            return True
         
         # Mouse down
-        extra = ctypes.c_ulong(0)
-        ii_ = InputI()
-        ii_.mi = MouseInput(0, 0, 0, MOUSEEVENTF_RIGHTDOWN, 0, ctypes.pointer(extra))
-        x = Input(INPUT_MOUSE, ii_)
-        ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+        _SendInput(1, ctypes.byref(_RIGHT_DOWN_INPUT), _INPUT_SIZE)
         
-        time.sleep(0.05)
+        _precise_wait(_CLICK_DELAY)
         
         # Mouse up
-        extra = ctypes.c_ulong(0)
-        ii_ = InputI()
-        ii_.mi = MouseInput(0, 0, 0, MOUSEEVENTF_RIGHTUP, 0, ctypes.pointer(extra))
-        x = Input(INPUT_MOUSE, ii_)
-        ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+        _SendInput(1, ctypes.byref(_RIGHT_UP_INPUT), _INPUT_SIZE)
         
         return True
     except Exception as e:
@@ -822,8 +889,9 @@ def _click_method_set_cursor_pos(hwnd=None):
     """SetCursorPos + mouse_event method"""
     try:
         # Get current cursor position to restore later
-        cursor_info = win32gui.GetCursorInfo()
-        original_x, original_y = cursor_info[2]
+        if not _GetCursorPos(ctypes.byref(_CURSOR_POINT)):
+            raise ctypes.WinError(ctypes.get_last_error())
+        original_x, original_y = _CURSOR_POINT.x, _CURSOR_POINT.y
         
         # Calculate target position
         target_x, target_y = original_x, original_y
@@ -833,17 +901,17 @@ def _click_method_set_cursor_pos(hwnd=None):
             target_y = top + (bottom - top) // 2
         
         # Move cursor
-        ctypes.windll.user32.SetCursorPos(target_x, target_y)
+        _SetCursorPos(target_x, target_y)
         
         # Click
         MOUSEEVENTF_RIGHTDOWN = 0x0008
         MOUSEEVENTF_RIGHTUP = 0x0010
-        ctypes.windll.user32.mouse_event(MOUSEEVENTF_RIGHTDOWN, 0, 0, 0, 0)
-        time.sleep(0.05)
-        ctypes.windll.user32.mouse_event(MOUSEEVENTF_RIGHTUP, 0, 0, 0, 0)
+        _mouse_event(MOUSEEVENTF_RIGHTDOWN, 0, 0, 0, 0)
+        _precise_wait(_CLICK_DELAY)
+        _mouse_event(MOUSEEVENTF_RIGHTUP, 0, 0, 0, 0)
         
         # Restore cursor position
-        ctypes.windll.user32.SetCursorPos(original_x, original_y)
+        _SetCursorPos(original_x, original_y)
         
         return True
     except Exception as e:
@@ -851,12 +919,26 @@ def _click_method_set_cursor_pos(hwnd=None):
         return False
 
 
+# Primary screen size, read on first use; resolution changes are rare
+_SCREEN_SIZE = None
+
+def refresh_screen_metrics():
+    """
+    Re-read the primary screen size, e.g. after a display change
+    
+    Returns:
+        (width, height) tuple of the primary screen
+    """
+    global _SCREEN_SIZE
+    _SCREEN_SIZE = (_GetSystemMetrics(0), _GetSystemMetrics(1))
+    return _SCREEN_SIZE
+
+
 def _click_method_send_input_absolute(hwnd=None):
     """SendInput with absolute coordinates method"""
     try:
         # Get screen dimensions for coordinate conversion
-        screen_width = ctypes.windll.user32.GetSystemMetrics(0)
-        screen_height = ctypes.windll.user32.GetSystemMetrics(1)
+        screen_width, screen_height = _SCREEN_SIZE or refresh_screen_metrics()
         
         # Calculate position
         target_x, target_y = screen_width // 2, screen_height // 2
@@ -869,36 +951,19 @@ def _click_method_send_input_absolute(hwnd=None):
         norm_x = int(65535 * target_x / screen_width)
         norm_y = int(65535 * target_y / screen_height)
         
-        INPUT_MOUSE = 0
-        MOUSEEVENTF_RIGHTDOWN = 0x0008
-        MOUSEEVENTF_RIGHTUP = 0x0010
-        MOUSEEVENTF_ABSOLUTE = 0x8000
-        MOUSEEVENTF_MOVE = 0x0001
-        
         # Move mouse to position
-        extra = ctypes.c_ulong(0)
-        ii_ = InputI()
-        ii_.mi = MouseInput(norm_x, norm_y, 0, MOUSEEVENTF_ABSOLUTE | MOUSEEVENTF_MOVE, 0, ctypes.pointer(extra))
-        x = Input(INPUT_MOUSE, ii_)
-        ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+        move = _mouse_input(MOUSEEVENTF_ABSOLUTE | MOUSEEVENTF_MOVE, norm_x, norm_y)
+        _SendInput(1, ctypes.byref(move), _INPUT_SIZE)
         
-        time.sleep(0.05)
+        _precise_wait(_CLICK_DELAY)
         
         # Mouse down
-        extra = ctypes.c_ulong(0)
-        ii_ = InputI()
-        ii_.mi = MouseInput(0, 0, 0, MOUSEEVENTF_RIGHTDOWN, 0, ctypes.pointer(extra))
-        x = Input(INPUT_MOUSE, ii_)
-        ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+        _SendInput(1, ctypes.byref(_RIGHT_DOWN_INPUT), _INPUT_SIZE)
         
-        time.sleep(0.05)
+        _precise_wait(_CLICK_DELAY)
         
         # Mouse up
-        extra = ctypes.c_ulong(0)
-        ii_ = InputI()
-        ii_.mi = MouseInput(0, 0, 0, MOUSEEVENTF_RIGHTUP, 0, ctypes.pointer(extra))
-        x = Input(INPUT_MOUSE, ii_)
-        ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+        _SendInput(1, ctypes.byref(_RIGHT_UP_INPUT), _INPUT_SIZE)
         
         return True
     except Exception as e:
@@ -906,24 +971,30 @@ def _click_method_send_input_absolute(hwnd=None):
         return False
 
 
+VK_RCONTROL = 0xA3
+VK_RMENU = 0xA5  # Right Alt key
+
+# Right Ctrl down, Right Alt down, Right Alt up, Right Ctrl up
+_KEY_COMBINATION_INPUTS = (Input * 4)(
+    _key_input(VK_RCONTROL),
+    _key_input(VK_RMENU),
+    _key_input(VK_RMENU, KEYEVENTF_KEYUP),
+    _key_input(VK_RCONTROL, KEYEVENTF_KEYUP)
+)
+
 def _click_method_key_combination():
     """Try keyboard shortcut (Right Ctrl + Right Alt) as alternative"""
     try:
-        VK_RCONTROL = 0xA3
-        VK_RMENU = 0xA5  # Right Alt key
-        KEYEVENTF_KEYUP = 0x0002
+        # Without a gap, submit the whole chord together
+        if not _CLICK_DELAY:
+            _SendInput(4, _KEY_COMBINATION_INPUTS, _INPUT_SIZE)
+            return True
         
-        # Press Right Control
-        ctypes.windll.user32.keybd_event(VK_RCONTROL, 0, 0, 0)
-        time.sleep(0.05)
-        # Press Right Alt
-        ctypes.windll.user32.keybd_event(VK_RMENU, 0, 0, 0)
-        time.sleep(0.05)
-        # Release Right Alt
-        ctypes.windll.user32.keybd_event(VK_RMENU, 0, KEYEVENTF_KEYUP, 0)
-        time.sleep(0.05)
-        # Release Right Control
-        ctypes.windll.user32.keybd_event(VK_RCONTROL, 0, KEYEVENTF_KEYUP, 0)
+        # Press Right Control and Right Alt
+        _SendInput(2, _KEY_COMBINATION_INPUTS, _INPUT_SIZE)
+        _precise_wait(_CLICK_DELAY)
+        # Release Right Alt and Right Control
+        _SendInput(2, ctypes.byref(_KEY_COMBINATION_INPUTS[2]), _INPUT_SIZE)
         
         return True
     except Exception as e:
@@ -12,56 +12,30 @@ import win32api
 import ctypes
 from ctypes import wintypes
 
-# Import structures if available, otherwise define them here
-try:
-    from app.windows_utils.input_structures import MouseInput, InputI, Input
-except ImportError:
-    # Define pointers and structures for Windows API input simulation
-    PUL = ctypes.POINTER(ctypes.c_ulong)
+# INPUT records are built with the same structures and helpers as app.window_utils
+from app.window_utils import (Input, _mouse_input, _key_input, _INPUT_SIZE, _RIGHT_DOWN_INPUT,
+                              _RIGHT_UP_INPUT, _SendInput)
+from app.windows_utils.keyboard import get_virtual_key_code
 
-    class KeyBdInput(ctypes.Structure):
-        """Keyboard input structure for SendInput"""
-        _fields_ = [
-            ("wVk", ctypes.c_ushort),
-            ("wScan", ctypes.c_ushort),
-            ("dwFlags", ctypes.c_ulong),
-            ("time", ctypes.c_ulong),
-            ("dwExtraInfo", PUL)
-        ]
+# user32 entry points used on the spellcasting path, resolved once at import
+_user32 = ctypes.windll.user32
+_mouse_event = _user32.mouse_event
+_get_cursor_pos = _user32.GetCursorPos
 
-    class HardwareInput(ctypes.Structure):
-        """Hardware input structure for SendInput"""
-        _fields_ = [
-            ("uMsg", ctypes.c_ulong),
-            ("wParamL", ctypes.c_short),
-            ("wParamH", ctypes.c_ushort)
-        ]
+# Reused out-parameter for GetCursorPos
+_CURSOR_POINT = wintypes.POINT()
 
-    class MouseInput(ctypes.Structure):
-        """Mouse input structure for SendInput"""
-        _fields_ = [
-            ("dx", ctypes.c_long),
-            ("dy", ctypes.c_long),
-            ("mouseData", ctypes.c_ulong),
-            ("dwFlags", ctypes.c_ulong),
-            ("time", ctypes.c_ulong),
-            ("dwExtraInfo", PUL)
-        ]
+KEYEVENTF_KEYUP = 0x0002
+MOUSEEVENTF_MOVE = 0x0001
+MOUSEEVENTF_RIGHTDOWN = 0x0008
+MOUSEEVENTF_RIGHTUP = 0x0010
+MOUSEEVENTF_LEFTDOWN = 0x0002
+MOUSEEVENTF_LEFTUP = 0x0004
+MOUSEEVENTF_ABSOLUTE = 0x8000
 
-    class InputI(ctypes.Union):
-        """Input union for SendInput"""
-        _fields_ = [
-            ("ki", KeyBdInput),
-            ("mi", MouseInput),
-            ("hi", HardwareInput)
-        ]
-
-    class Input(ctypes.Structure):
-        """Input structure for SendInput"""
-        _fields_ = [
-            ("type", ctypes.c_ulong),
-            ("ii", InputI)
-        ]
+# Single-button left records for the SendInput click fallback, passed by reference
+_LEFT_DOWN_INPUT = _mouse_input(MOUSEEVENTF_LEFTDOWN)
+_LEFT_UP_INPUT = _mouse_input(MOUSEEVENTF_LEFTUP)
 
 # Enhanced move_mouse_direct function for app/windows_utils/mouse.py
 def move_mouse_direct(x, y):
@@ -140,23 +114,29 @@ def press_right_mouse(hwnd=None, target_x=None, target_y=None, method=None):
     """
     # Get logger within the function scope
     logger = logging.getLogger('PristonBot')
-    logger.debug(f"Entered press_right_mouse function with target: ({target_x}, {target_y})")
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug(f"Entered press_right_mouse function with target: ({target_x}, {target_y})")
     success = False
 
     # Store original cursor position if we're moving it
+    moving = target_x is not None and target_y is not None
     original_pos = None
-    if target_x is not None and target_y is not None:
+    if moving:
         try:
-            cursor_info = win32gui.GetCursorInfo()
-            original_pos = cursor_info[2]  # (x, y) tuple
-            logger.debug(f"Saved original cursor position: {original_pos}")
+            if not _get_cursor_pos(ctypes.byref(_CURSOR_POINT)):
+                raise ctypes.WinError()
+            original_pos = (_CURSOR_POINT.x, _CURSOR_POINT.y)
+            if debug:
+                logger.debug(f"Saved original cursor position: {original_pos}")
         except Exception as e:
             logger.warning(f"Could not get original cursor position: {e}")
     
     try:
         # Move cursor to target position if specified using the enhanced direct method
-        if target_x is not None and target_y is not None:
-            logger.debug(f"Moving cursor to position ({target_x}, {target_y})")
+        if moving:
+            if debug:
+                logger.debug(f"Moving cursor to position ({target_x}, {target_y})")
             move_mouse_direct(target_x, target_y)
             # Give time for the cursor to move and the game to register it
             time.sleep(0.1)
@@ -173,52 +153,37 @@ def press_right_mouse(hwnd=None, target_x=None, target_y=None, method=None):
         
         # Try direct approach for right click
         try:
-            logger.debug(f"Right-clicking with mouse_event")
-            MOUSEEVENTF_RIGHTDOWN = 0x0008
-            MOUSEEVENTF_RIGHTUP = 0x0010
+            logger.debug("Right-clicking with mouse_event")
             
             # Mouse down
-            ctypes.windll.user32.mouse_event(MOUSEEVENTF_RIGHTDOWN, 0, 0, 0, 0)
+            _mouse_event(MOUSEEVENTF_RIGHTDOWN, 0, 0, 0, 0)
             time.sleep(0.1)  # Longer delay between down and up for game to register
             
             # Mouse up
-            ctypes.windll.user32.mouse_event(MOUSEEVENTF_RIGHTUP, 0, 0, 0, 0)
+            _mouse_event(MOUSEEVENTF_RIGHTUP, 0, 0, 0, 0)
             
             success = True
             
         except Exception as e:
-            logger.error(f"Error with mouse_event click: {e}", exc_info=True)
+            logger.warning(f"Error with mouse_event click: {e}")
             
             # Try SendInput method
             try:
                 logger.debug(f"Trying SendInput for right-click")
                 
-                # Define constants
-                INPUT_MOUSE = 0
-                MOUSEEVENTF_RIGHTDOWN = 0x0008
-                MOUSEEVENTF_RIGHTUP = 0x0010
-                
                 # Mouse down
-                extra = ctypes.c_ulong(0)
-                ii_ = InputI()
-                ii_.mi = MouseInput(0, 0, 0, MOUSEEVENTF_RIGHTDOWN, 0, ctypes.pointer(extra))
-                x = Input(INPUT_MOUSE, ii_)
-                ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+                _SendInput(1, ctypes.byref(_RIGHT_DOWN_INPUT), _INPUT_SIZE)
                 
                 # Small delay between down and up
                 time.sleep(0.1)
                 
                 # Mouse up
-                extra = ctypes.c_ulong(0)
-                ii_ = InputI()
-                ii_.mi = MouseInput(0, 0, 0, MOUSEEVENTF_RIGHTUP, 0, ctypes.pointer(extra))
-                x = Input(INPUT_MOUSE, ii_)
-                ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+                _SendInput(1, ctypes.byref(_RIGHT_UP_INPUT), _INPUT_SIZE)
                 
                 success = True
                 
             except Exception as e2:
-                logger.error(f"Error with SendInput click: {e2}", exc_info=True)
+                logger.warning(f"Error with SendInput click: {e2}")
         
         if not success and hwnd:
             # Last resort: Try sending messages directly to the window
@@ -261,8 +226,9 @@ def press_right_mouse(hwnd=None, target_x=None, target_y=None, method=None):
         if original_pos is not None:
             # Wait slightly longer before restoring position to ensure click is registered
             time.sleep(0.2)
-            logger.debug(f"Restoring cursor to original position: {original_pos}")
-            ctypes.windll.user32.SetCursorPos(original_pos[0], original_pos[1])
+            if debug:
+                logger.debug(f"Restoring cursor to original position: {original_pos}")
+            _user32.SetCursorPos(original_pos[0], original_pos[1])
 
 def press_left_mouse(hwnd=None, target_x=None, target_y=None):
     """
@@ -321,37 +287,24 @@ def press_left_mouse(hwnd=None, target_x=None, target_y=None):
             return True
             
         except Exception as e:
-            logger.error(f"Error with mouse_event left-click: {e}", exc_info=True)
+            logger.warning(f"Error with mouse_event left-click: {e}")
             
             # Try SendInput as backup
             try:
                 logger.debug(f"Trying SendInput for left-click")
                 
-                # Define constants
-                INPUT_MOUSE = 0
-                MOUSEEVENTF_LEFTDOWN = 0x0002
-                MOUSEEVENTF_LEFTUP = 0x0004
-                
                 # Mouse down
-                extra = ctypes.c_ulong(0)
-                ii_ = InputI()
-                ii_.mi = MouseInput(0, 0, 0, MOUSEEVENTF_LEFTDOWN, 0, ctypes.pointer(extra))
-                x = Input(INPUT_MOUSE, ii_)
-                ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+                _SendInput(1, ctypes.byref(_LEFT_DOWN_INPUT), _INPUT_SIZE)
                 
                 time.sleep(0.1)
                 
                 # Mouse up
-                extra = ctypes.c_ulong(0)
-                ii_ = InputI()
-                ii_.mi = MouseInput(0, 0, 0, MOUSEEVENTF_LEFTUP, 0, ctypes.pointer(extra))
-                x = Input(INPUT_MOUSE, ii_)
-                ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+                _SendInput(1, ctypes.byref(_LEFT_UP_INPUT), _INPUT_SIZE)
                 
                 return True
                 
             except Exception as e2:
-                logger.error(f"Error with SendInput left-click: {e2}", exc_info=True)
+                logger.warning(f"Error with SendInput left-click: {e2}")
             
             # Last resort if we have a window handle
             if hwnd:
@@ -517,25 +470,13 @@ def _click_method_send_input():
     """SendInput method for global clicking"""
     logger = logging.getLogger('PristonBot')
     try:
-        INPUT_MOUSE = 0
-        MOUSEEVENTF_RIGHTDOWN = 0x0008
-        MOUSEEVENTF_RIGHTUP = 0x0010
-        
         # Mouse down
-        extra = ctypes.c_ulong(0)
-        ii_ = InputI()
-        ii_.mi = MouseInput(0, 0, 0, MOUSEEVENTF_RIGHTDOWN, 0, ctypes.pointer(extra))
-        x = Input(INPUT_MOUSE, ii_)
-        ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+        _SendInput(1, ctypes.byref(_RIGHT_DOWN_INPUT), _INPUT_SIZE)
         
         time.sleep(0.1)
         
         # Mouse up
-        extra = ctypes.c_ulong(0)
-        ii_ = InputI()
-        ii_.mi = MouseInput(0, 0, 0, MOUSEEVENTF_RIGHTUP, 0, ctypes.pointer(extra))
-        x = Input(INPUT_MOUSE, ii_)
-        ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+        _SendInput(1, ctypes.byref(_RIGHT_UP_INPUT), _INPUT_SIZE)
         
         return True
     except Exception as e:
@@ -563,4 +504,53 @@ def _click_method_send_message(hwnd):
         return True
     except Exception as e:
         logger.debug(f"SendMessage click failed: {e}")
-        return False
\ No newline at end of file
+        return False
+
+def _send_inputs(inputs):
+    """Submit a prebuilt INPUT array in a single SendInput call"""
+    if _SendInput(len(inputs), inputs, _INPUT_SIZE) != len(inputs):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+def cast_spell_steps(spell_key, target_x=None, target_y=None):
+    """
+    Build the spell cast sequence as timed steps instead of sleeping between them
+    
+    Lets the caller interleave the cast with other work. The INPUT records
+    are built once here and each step submits them with a single SendInput;
+    for a targeted cast the cursor move and right-button press share one
+    call so nothing can be interleaved between them. The cursor is left
+    at the target.
+    
+    Args:
+        spell_key: Key the spell is bound to (e.g., "F1")
+        target_x: X-coordinate for the click, or None to use current position
+        target_y: Y-coordinate for the click, or None to use current position
+        
+    Returns:
+        List of (delay, action) tuples, where delay is seconds after the previous step
+    """
+    vk_code = get_virtual_key_code(spell_key)
+    key_down = (Input * 1)(_key_input(vk_code))
+    key_up = (Input * 1)(_key_input(vk_code, KEYEVENTF_KEYUP))
+    right_up = (Input * 1)(_RIGHT_UP_INPUT)
+    
+    if target_x is not None and target_y is not None:
+        # Absolute coordinates are normalized to 0..65535 across the primary screen
+        screen_width = _user32.GetSystemMetrics(0)
+        screen_height = _user32.GetSystemMetrics(1)
+        dx = int(target_x) * 65535 // max(screen_width - 1, 1)
+        dy = int(target_y) * 65535 // max(screen_height - 1, 1)
+        right_down = (Input * 2)(
+            _mouse_input(MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE, dx, dy),
+            _RIGHT_DOWN_INPUT
+        )
+    else:
+        right_down = (Input * 1)(_RIGHT_DOWN_INPUT)
+    
+    # The game needs the gaps between the steps to register the key and click
+    return [
+        (0.0, lambda: _send_inputs(key_down)),
+        (0.05, lambda: _send_inputs(key_up)),
+        (0.1, lambda: _send_inputs(right_down)),
+        (0.1, lambda: _send_inputs(right_up)),
+    ]
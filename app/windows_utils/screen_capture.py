@@ -0,0 +1,146 @@
+"""
+Screen Capture Utilities
+------------------------
+This module provides repeated capture of a fixed screen area into buffers
+that are allocated once and reused for every frame.
+"""
+
+import logging
+import ctypes
+from ctypes import wintypes
+import numpy as np
+import cv2
+
+logger = logging.getLogger('PristonBot')
+
+# Private DLL instances so the prototypes below don't leak into ctypes.windll users
+_user32 = ctypes.WinDLL('user32', use_last_error=True)
+_gdi32 = ctypes.WinDLL('gdi32', use_last_error=True)
+
+_user32.GetDC.argtypes = (wintypes.HWND,)
+_user32.GetDC.restype = wintypes.HDC
+_user32.ReleaseDC.argtypes = (wintypes.HWND, wintypes.HDC)
+_gdi32.CreateCompatibleDC.argtypes = (wintypes.HDC,)
+_gdi32.CreateCompatibleDC.restype = wintypes.HDC
+_gdi32.CreateDIBSection.argtypes = (wintypes.HDC, ctypes.c_void_p, wintypes.UINT,
+                                    ctypes.POINTER(ctypes.c_void_p), wintypes.HANDLE, wintypes.DWORD)
+_gdi32.CreateDIBSection.restype = wintypes.HBITMAP
+_gdi32.SelectObject.argtypes = (wintypes.HDC, wintypes.HGDIOBJ)
+_gdi32.SelectObject.restype = wintypes.HGDIOBJ
+_gdi32.BitBlt.argtypes = (wintypes.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                          wintypes.HDC, ctypes.c_int, ctypes.c_int, wintypes.DWORD)
+_gdi32.DeleteObject.argtypes = (wintypes.HGDIOBJ,)
+_gdi32.DeleteDC.argtypes = (wintypes.HDC,)
+
+# Per-monitor DPI awareness for the capture, matching PIL's ImageGrab (Windows 10+)
+_set_thread_dpi_awareness = getattr(_user32, 'SetThreadDpiAwarenessContext', None)
+if _set_thread_dpi_awareness is not None:
+    _set_thread_dpi_awareness.argtypes = (ctypes.c_void_p,)
+    _set_thread_dpi_awareness.restype = ctypes.c_void_p
+DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE = ctypes.c_void_p(-3)
+
+SRCCOPY = 0x00CC0020
+CAPTUREBLT = 0x40000000
+DIB_RGB_COLORS = 0
+BI_RGB = 0
+
+class BitmapInfoHeader(ctypes.Structure):
+    """BITMAPINFOHEADER structure for CreateDIBSection"""
+    _fields_ = [
+        ("biSize", wintypes.DWORD),
+        ("biWidth", wintypes.LONG),
+        ("biHeight", wintypes.LONG),
+        ("biPlanes", wintypes.WORD),
+        ("biBitCount", wintypes.WORD),
+        ("biCompression", wintypes.DWORD),
+        ("biSizeImage", wintypes.DWORD),
+        ("biXPelsPerMeter", wintypes.LONG),
+        ("biYPelsPerMeter", wintypes.LONG),
+        ("biClrUsed", wintypes.DWORD),
+        ("biClrImportant", wintypes.DWORD)
+    ]
+
+class ScreenCapture:
+    """Capture of a fixed screen area into a persistent buffer"""
+    
+    def __init__(self, bbox):
+        """
+        Set up the device contexts and buffers for a screen area
+        
+        Args:
+            bbox: (x1, y1, x2, y2) screen coordinates of the area to capture
+        """
+        x1, y1, x2, y2 = bbox
+        self.left = x1
+        self.top = y1
+        self.width = x2 - x1
+        self.height = y2 - y1
+        
+        self._screen_dc = _user32.GetDC(None)
+        self._mem_dc = _gdi32.CreateCompatibleDC(self._screen_dc)
+        
+        # Top-down 32-bit DIB whose pixels BitBlt writes straight into
+        header = BitmapInfoHeader()
+        header.biSize = ctypes.sizeof(BitmapInfoHeader)
+        header.biWidth = self.width
+        header.biHeight = -self.height
+        header.biPlanes = 1
+        header.biBitCount = 32
+        header.biCompression = BI_RGB
+        bits = ctypes.c_void_p()
+        self._bitmap = _gdi32.CreateDIBSection(self._mem_dc, ctypes.byref(header), DIB_RGB_COLORS,
+                                               ctypes.byref(bits), None, 0)
+        if not self._bitmap:
+            error = ctypes.WinError(ctypes.get_last_error())
+            self.close()
+            raise error
+        self._old_bitmap = _gdi32.SelectObject(self._mem_dc, self._bitmap)
+        
+        # View the DIB memory as BGRA without copying, plus two RGB frames used
+        # alternately so the previous frame stays intact for comparison
+        pixels = (ctypes.c_ubyte * (self.width * self.height * 4)).from_address(bits.value)
+        self._bgra = np.frombuffer(pixels, dtype=np.uint8).reshape(self.height, self.width, 4)
+        self._frames = (
+            np.empty((self.height, self.width, 3), dtype=np.uint8),
+            np.empty((self.height, self.width, 3), dtype=np.uint8)
+        )
+        self._current = 0
+        
+        logger.debug(f"Screen capture ready for {self.width}x{self.height} at ({x1},{y1})")
+    
+    def grab(self):
+        """
+        Capture the area into the next of the two persistent frames
+        
+        Returns:
+            RGB numpy array of the area; it stays valid until the grab after next
+        """
+        previous = None
+        if _set_thread_dpi_awareness is not None:
+            previous = _set_thread_dpi_awareness(DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE)
+        try:
+            if not _gdi32.BitBlt(self._mem_dc, 0, 0, self.width, self.height,
+                                 self._screen_dc, self.left, self.top, SRCCOPY | CAPTUREBLT):
+                raise ctypes.WinError(ctypes.get_last_error())
+        finally:
+            if previous:
+                _set_thread_dpi_awareness(previous)
+        
+        # Convert BGRA into the other RGB frame in one pass, leaving the previous one untouched
+        self._current ^= 1
+        frame = self._frames[self._current]
+        cv2.cvtColor(self._bgra, cv2.COLOR_BGRA2RGB, dst=frame)
+        return frame
+    
+    def close(self):
+        """Release the device contexts and bitmap"""
+        if getattr(self, '_bitmap', None):
+            _gdi32.SelectObject(self._mem_dc, self._old_bitmap)
+            _gdi32.DeleteObject(self._bitmap)
+            self._bitmap = None
+        if self._mem_dc:
+            _gdi32.DeleteDC(self._mem_dc)
+            self._mem_dc = None
+        if self._screen_dc:
+            _user32.ReleaseDC(None, self._screen_dc)
+            self._screen_dc = None
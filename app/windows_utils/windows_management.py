@@ -11,141 +11,25 @@ import win32con
 import ctypes
 from ctypes import wintypes
 
+# The window lookup, with its cached handle, and focusing are shared with app.window_utils
+from app.window_utils import find_game_window, focus_game_window, _get_window_title, _SystemParametersInfoW
+
 logger = logging.getLogger('PristonBot')
 
-def find_game_window(window_name="Priston Tale"):
-    """
-    Find the game window by name
-    
-    Args:
-        window_name: The name of the window to find (default: "Priston Tale")
-        
-    Returns:
-        Window handle if found, None otherwise
-    """
-    logger.info(f"Searching for game window: {window_name}")
-    
-    # Try direct match first
-    hwnd = win32gui.FindWindow(None, window_name)
-    if hwnd != 0:
-        logger.info(f"Found exact window match with handle {hwnd}")
-        return hwnd
-    
-    # If not found, try partial match
-    windows = []
-    def callback(hwnd, windows):
-        if win32gui.IsWindowVisible(hwnd) and win32gui.IsWindow(hwnd):
-            title = win32gui.GetWindowText(hwnd)
-            if window_name.lower() in title.lower():
-                windows.append((hwnd, title))
-        return True
-    
-    win32gui.EnumWindows(callback, windows)
-    
-    if windows:
-        logger.info(f"Found similar window: '{windows[0][1]}' with handle {windows[0][0]}")
-        return windows[0][0]
-    
-    logger.warning(f"Game window '{window_name}' not found")
-    return None
-
-def focus_game_window(hwnd):
-    """
-    Bring the game window to the foreground
-    
-    Args:
-        hwnd: Window handle
-        
-    Returns:
-        True if successful, False otherwise
-    """
-    if not hwnd:
-        logger.warning("Cannot focus window: Invalid handle")
-        return False
-    
-    try:
-        # Get window title for logging
-        window_title = win32gui.GetWindowText(hwnd)
-        logger.info(f"Focusing window: {window_title}")
-        
-        # Check if window is already in foreground
-        current_foreground = win32gui.GetForegroundWindow()
-        if current_foreground == hwnd:
-            logger.debug("Window already in foreground")
-            return True
-            
-        # Try to bring window to foreground
-        logger.debug(f"Current foreground: {win32gui.GetWindowText(current_foreground)}, need to focus {window_title}")
-        
-        # Check if window is minimized
-        if win32gui.IsIconic(hwnd):
-            logger.debug("Window is minimized, restoring")
-            win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-            time.sleep(0.1)  # Give it time to restore
-        
-        # Try multiple methods to focus the window
-        try:
-            # Standard method
-            win32gui.SetForegroundWindow(hwnd)
-        except Exception as e:
-            logger.warning(f"Standard SetForegroundWindow failed: {e}")
-            try:
-                # Alternative method using AttachThreadInput
-                foreground_thread = ctypes.windll.user32.GetWindowThreadProcessId(
-                    win32gui.GetForegroundWindow(), None)
-                current_thread = ctypes.windll.kernel32.GetCurrentThreadId()
-                
-                # Attach threads
-                ctypes.windll.user32.AttachThreadInput(foreground_thread, current_thread, True)
-                
-                # Show and focus window
-                win32gui.ShowWindow(hwnd, win32con.SW_SHOW)
-                win32gui.SetForegroundWindow(hwnd)
-                
-                # Detach threads
-                ctypes.windll.user32.AttachThreadInput(foreground_thread, current_thread, False)
-            except Exception as e2:
-                logger.error(f"Alternative focus method failed: {e2}")
-                
-                try:
-                    # Final attempt using ASFW_ANY
-                    SPI_GETFOREGROUNDLOCKTIMEOUT = 0x2000
-                    SPI_SETFOREGROUNDLOCKTIMEOUT = 0x2001
-                    SPIF_SENDCHANGE = 0x2
-                    
-                    # Save current timeout
-                    timeout_buf = wintypes.DWORD(0)
-                    ctypes.windll.user32.SystemParametersInfoW(
-                        SPI_GETFOREGROUNDLOCKTIMEOUT, 0, ctypes.byref(timeout_buf), 0)
-                    
-                    # Set timeout to 0
-                    ctypes.windll.user32.SystemParametersInfoW(
-                        SPI_SETFOREGROUNDLOCKTIMEOUT, 0, ctypes.c_void_p(0), SPIF_SENDCHANGE)
-                    
-                    # Try to set foreground window
-                    win32gui.SetForegroundWindow(hwnd)
-                    
-                    # Restore timeout
-                    ctypes.windll.user32.SystemParametersInfoW(
-                        SPI_SETFOREGROUNDLOCKTIMEOUT, 0, timeout_buf, SPIF_SENDCHANGE)
-                except Exception as e3:
-                    logger.error(f"Final focus attempt failed: {e3}")
-        
-        # Give window time to come to foreground
-        time.sleep(0.2)
-        
-        # Verify window is in foreground
-        new_foreground = win32gui.GetForegroundWindow()
-        if new_foreground != hwnd:
-            logger.warning(f"Focus verification failed. Current foreground: {win32gui.GetWindowText(new_foreground)}")
-            return False
-        
-        logger.info("Window focus successful")
-        return True
-        
-    except Exception as e:
-        logger.error(f"Error focusing game window: {e}", exc_info=True)
-        return False
+# Client-area lookups with declared prototypes, on a private DLL instance
+_user32 = ctypes.WinDLL('user32', use_last_error=True)
+_user32.GetClientRect.argtypes = (wintypes.HWND, ctypes.POINTER(wintypes.RECT))
+_user32.GetClientRect.restype = wintypes.BOOL
+_user32.MapWindowPoints.argtypes = (wintypes.HWND, wintypes.HWND, ctypes.POINTER(wintypes.RECT), wintypes.UINT)
+_user32.MapWindowPoints.restype = ctypes.c_int
+_user32.GetSystemMetrics.argtypes = (ctypes.c_int,)
+_user32.GetSystemMetrics.restype = ctypes.c_int
+
+# DWM attribute set on windows that are visible but not shown, like suspended UWP apps
+_dwmapi = ctypes.WinDLL('dwmapi')
+_dwmapi.DwmGetWindowAttribute.argtypes = (wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD)
+_dwmapi.DwmGetWindowAttribute.restype = ctypes.c_long
+DWMWA_CLOAKED = 14
 
 def get_window_rect(hwnd):
     """
@@ -182,18 +66,18 @@ def get_client_area(hwnd):
         return None
     
     try:
-        # Get window rect in screen coordinates
-        left, top, right, bottom = win32gui.GetWindowRect(hwnd)
-        
         # Get client rect in client coordinates (relative to window)
-        client_rect = win32gui.GetClientRect(hwnd)
-        client_left, client_top, client_right, client_bottom = client_rect
+        rect = wintypes.RECT()
+        if not _user32.GetClientRect(hwnd, ctypes.byref(rect)):
+            raise ctypes.WinError(ctypes.get_last_error())
         
-        # Convert the client rect to screen coordinates
-        client_left_screen, client_top_screen = win32gui.ClientToScreen(hwnd, (client_left, client_top))
-        client_right_screen, client_bottom_screen = win32gui.ClientToScreen(hwnd, (client_right, client_bottom))
+        # Convert both corners to screen coordinates in place; 0 is also a
+        # valid offset, so only the last error tells a failure apart
+        ctypes.set_last_error(0)
+        if not _user32.MapWindowPoints(hwnd, None, ctypes.byref(rect), 2) and ctypes.get_last_error():
+            raise ctypes.WinError(ctypes.get_last_error())
         
-        return (client_left_screen, client_top_screen, client_right_screen, client_bottom_screen)
+        return (rect.left, rect.top, rect.right, rect.bottom)
     except Exception as e:
         logger.error(f"Error getting client area: {e}")
         return None
@@ -236,16 +120,26 @@ def get_client_center(hwnd):
 
 def get_all_windows():
     """
-    Get a list of all visible windows with titles
+    Get a list of all visible application windows with titles
+    
+    Tool windows and cloaked windows are skipped before their titles are read.
     
     Returns:
         List of (hwnd, title) tuples
     """
     windows = []
+    title_buffer = ctypes.create_unicode_buffer(256)
+    cloaked = wintypes.DWORD()
     
     def callback(hwnd, windows):
-        if win32gui.IsWindowVisible(hwnd) and win32gui.IsWindow(hwnd):
-            title = win32gui.GetWindowText(hwnd)
+        if win32gui.IsWindowVisible(hwnd):
+            ex_style = win32gui.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
+            if ex_style & win32con.WS_EX_TOOLWINDOW and not ex_style & win32con.WS_EX_APPWINDOW:
+                return True
+            if (_dwmapi.DwmGetWindowAttribute(hwnd, DWMWA_CLOAKED, ctypes.byref(cloaked),
+                                              ctypes.sizeof(cloaked)) == 0 and cloaked.value):
+                return True
+            title = _get_window_title(hwnd, title_buffer)
             if title:  # Only include windows with titles
                 windows.append((hwnd, title))
         return True
@@ -294,8 +188,8 @@ def is_window_fullscreen(hwnd):
             return False
             
         # Get screen dimensions
-        screen_width = ctypes.windll.user32.GetSystemMetrics(0)
-        screen_height = ctypes.windll.user32.GetSystemMetrics(1)
+        screen_width = _user32.GetSystemMetrics(0)
+        screen_height = _user32.GetSystemMetrics(1)
         
         # Check if window covers the entire screen
         left, top, right, bottom = window_rect
@@ -758,10 +652,10 @@ def set_foreground_window_timeout(timeout_ms):
         SPI_SETFOREGROUNDLOCKTIMEOUT = 0x2001
         SPIF_SENDCHANGE = 0x2
         
-        result = ctypes.windll.user32.SystemParametersInfoW(
+        result = _SystemParametersInfoW(
             SPI_SETFOREGROUNDLOCKTIMEOUT, 
             0, 
-            ctypes.c_void_p(timeout_ms), 
+            timeout_ms, 
             SPIF_SENDCHANGE
         )
         
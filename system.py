@@ -8,6 +8,8 @@ with enhanced UI and user experience.
 
 import os
 import sys
+import atexit
+import queue
 import logging
 import tkinter as tk
 from tkinter import ttk, messagebox
@@ -29,7 +31,7 @@ def setup_logging():
     
     # Create handlers
     # File handler with rotation
-    from logging.handlers import RotatingFileHandler
+    from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
     log_file = os.path.join('logs', f'priston_bot_{time.strftime("%Y%m%d_%H%M%S")}.log')
     file_handler = RotatingFileHandler(
         log_file, 
@@ -39,14 +41,18 @@ def setup_logging():
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(file_formatter)
     
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    
     # Add console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.DEBUG)
     console_handler.setFormatter(logging.Formatter('%(levelname)s - %(message)s'))
-    logger.addHandler(console_handler)
+    
+    # Hand records to a listener thread that owns the file and console output,
+    # so logging from the UI and bot threads never waits on disk writes
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(QueueHandler(log_queue))
     
     logger.info("Logging initialized")
     return logger
@@ -168,10 +174,8 @@ def main():
             logger.info(f"Created directory: {directory}")
     
     try:
-        # Small delay to show splash screen
-        time.sleep(1.5)
-        
         # Import the improved GUI after checking dependencies and setting up logging
+        # (the splash stays up while this runs, so no extra delay is needed)
         from app.gui import PristonTaleBot
         
         # Destroy splash screen